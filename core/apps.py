@@ -30,6 +30,12 @@ class CoreConfig(AppConfig):
         specified in the project documentation and saved into the local
         SQLite database.
         """
+        # Keep cached performance payloads in step with interview writes.
+        from django.db.models.signals import post_delete, post_save
+        from .models import Interview
+        from .signals import bump_performance_version
+        post_save.connect(bump_performance_version, sender=Interview, dispatch_uid='core.interview_saved')
+        post_delete.connect(bump_performance_version, sender=Interview, dispatch_uid='core.interview_deleted')
         # Only run this prompt when using the development server
         if 'runserver' not in sys.argv:
             return
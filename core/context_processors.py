@@ -10,6 +10,8 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from django.db.models import Count, Q
+
 
 def language(request) -> Dict[str, Any]:
     """Expose common variables (language and panel access) to all templates.
@@ -42,10 +44,14 @@ def language(request) -> Dict[str, Any]:
             for pf in panel_fields:
                 panels_enabled[pf] = True
         else:
-            # Aggregate panel permissions across all memberships
-            for membership in getattr(user, 'memberships', []).all():
-                for pf in panel_fields:
-                    panels_enabled[pf] = panels_enabled[pf] or getattr(membership, pf)
+            # Aggregate panel permissions across all memberships in the
+            # database: one conditional COUNT per panel, evaluated in a
+            # single pass, instead of looping over memberships in Python.
+            counts = user.memberships.aggregate(
+                **{pf: Count('id', filter=Q(**{pf: True})) for pf in panel_fields}
+            )
+            for pf in panel_fields:
+                panels_enabled[pf] = bool(counts[pf])
     return {
         'lang': lang,
         'panels_enabled': panels_enabled,
@@ -35,7 +35,7 @@ from core.models import DatabaseEntry
 
 try:
     # Import the ETL helper module which exposes run_once and FormSpec
-    from surveyzen_etl_generic import run_once, FormSpec, sanitize_identifier
+    from surveyzen_etl_generic import run_once, FormSpec, sanitize_identifier, close_pool
 except Exception as e:  # pragma: no cover
     raise ImportError(f"Failed to import ETL module: {e}")
 
@@ -106,7 +106,11 @@ class Command(BaseCommand):
             import time
             while True:
                 run_sync()
+                # Pooled ETL connections only help within a pass; do not
+                # hold them idle through the sleep.
+                close_pool()
                 # Sleep for 10 minutes
                 time.sleep(600)
         else:
-            run_sync()
\ No newline at end of file
+            run_sync()
+            close_pool()
\ No newline at end of file
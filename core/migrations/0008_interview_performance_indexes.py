@@ -0,0 +1,31 @@
+"""Migration adding composite indexes to Interview for performance views.
+
+The collection performance dashboard and its export filter interviews by
+project and a ``created_at`` range, then group by interviewer and count
+successful calls (``code == 1``).  Two composite indexes are introduced:
+
+* ``(project, created_at, code)`` serves the project/date range filter
+  and lets the success counter read ``code`` from the index.
+* ``(user, project, created_at)`` serves the per-interviewer views, where
+  non-organisation users only ever see their own interviews.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_databaseentry_sync_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['project', 'created_at', 'code'], name='interview_proj_created_code'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['user', 'project', 'created_at'], name='interview_user_proj_created'),
+        ),
+    ]
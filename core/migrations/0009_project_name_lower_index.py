@@ -0,0 +1,24 @@
+"""Migration adding a functional index on ``LOWER(name)`` for Project.
+
+Accessible projects are now returned ordered by case-insensitive name
+directly from the database rather than being sorted in Python on every
+page load.  The expression index lets PostgreSQL satisfy that ordering
+without a separate sort step.
+"""
+
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_interview_performance_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(Lower('name'), name='proj_name_lower_idx'),
+        ),
+    ]
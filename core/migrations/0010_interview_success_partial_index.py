@@ -0,0 +1,28 @@
+"""Migration adding a partial index over successful interviews.
+
+The performance dashboard counts successful calls with
+``Count('id', filter=Q(code=1))``.  A partial index restricted to
+``code = 1`` over ``(project, user, created_at)`` holds only those rows,
+so per-project and per-interviewer success counts over a date range can
+be answered from a much smaller index than the full composite ones.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_project_name_lower_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(
+                condition=models.Q(code=1),
+                fields=['project', 'user', 'created_at'],
+                name='interview_success_idx',
+            ),
+        ),
+    ]
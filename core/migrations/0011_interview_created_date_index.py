@@ -0,0 +1,26 @@
+"""Migration adding an expression index on the interview date.
+
+The daily trend on the performance dashboard groups interviews by
+``TruncDate('created_at')``, which PostgreSQL evaluates as
+``(created_at AT TIME ZONE '<TIME_ZONE>')::date`` for every row.  This
+index stores that expression (together with ``project_id``) so the
+planner can read the day straight from the index.  The index is
+declared through the ORM so its expression matches the queries exactly.
+"""
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_interview_success_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(TruncDate('created_at'), models.F('project'), name='interview_created_date_idx'),
+        ),
+    ]
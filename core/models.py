@@ -12,6 +12,7 @@ permissions are governed exclusively via the ``Membership`` model.
 from __future__ import annotations
 
 from django.db import models
+from django.db.models.functions import Lower, TruncDate
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField  # type: ignore
 
@@ -118,6 +119,12 @@ class Project(models.Model):
     sample_size = models.PositiveIntegerField()
     filled_samples = models.PositiveIntegerField(default=0)
 
+    class Meta:
+        # Project pickers list projects by case-insensitive name
+        indexes = [
+            models.Index(Lower('name'), name='proj_name_lower_idx'),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover
         return self.name
 
@@ -197,6 +204,25 @@ class Interview(models.Model):
     # not been submitted.
     end_form = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        # The performance dashboard filters on project and a created_at
+        # range and counts successes by code; organisation views filter
+        # on interviewer first.
+        indexes = [
+            models.Index(fields=['project', 'created_at', 'code'], name='interview_proj_created_code'),
+            models.Index(fields=['user', 'project', 'created_at'], name='interview_user_proj_created'),
+            # Partial index covering only successful calls, which keeps
+            # the success counters small and cheap to scan.
+            models.Index(
+                fields=['project', 'user', 'created_at'],
+                name='interview_success_idx',
+                condition=models.Q(code=1),
+            ),
+            # Matches the TruncDate('created_at') grouping of the daily
+            # trend, so the per-row date conversion can come from the index.
+            models.Index(TruncDate('created_at'), 'project', name='interview_created_date_idx'),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover
         return f"Interview {self.pk} in project {self.project_id}"  # type: ignore[str-format]
 
@@ -0,0 +1,48 @@
+"""Signal handlers for the core app.
+
+The collection performance dashboard caches its aggregated chart
+payloads for a short time.  Every cache key embeds the version stamps
+of the projects the payload covers; saving or deleting an interview
+bumps the stamp of its project, while cached payloads for unrelated
+projects stay valid.
+
+The bump only reaches processes that share the cache.  With a shared
+backend (``REDIS_URL``) stale payloads are not served after a change;
+with the default per-process ``LocMemCache`` other workers keep their
+own stamps, so their staleness is bounded by the payload TTL (60 s).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.core.cache import cache
+
+
+def _version_key(project_id: int) -> str:
+    return f'cp:version:{project_id}'
+
+
+def get_performance_version(project_ids: Iterable[int]) -> str:
+    """Return a combined version stamp for the given projects.
+
+    Missing stamps are initialised to ``1``.  All stamps are read with a
+    single ``get_many`` round trip.
+    """
+    keys = {pid: _version_key(pid) for pid in sorted(set(project_ids))}
+    found = cache.get_many(list(keys.values()))
+    missing = {key: 1 for key in keys.values() if key not in found}
+    if missing:
+        cache.set_many(missing, None)
+        found.update(missing)
+    return '.'.join(f"{pid}-{found[key]}" for pid, key in keys.items())
+
+
+def bump_performance_version(sender, instance, **kwargs) -> None:
+    """Invalidate cached payloads for the project of a changed interview."""
+    key = _version_key(instance.project_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key missing or evicted; any new value invalidates old entries
+        cache.set(key, 2, None)
@@ -14,13 +14,15 @@ from __future__ import annotations
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Optional
 
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.db.models import Sum, Count, Q, F
+from django.db.models import Sum, Count, Q, F, Prefetch
+from django.db.models.functions import Lower
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -74,6 +76,58 @@ from .models import (
 )
 
 
+# Outcome codes offered to telephone interviewers, keyed by language.
+# Built once at import rather than re-evaluated on every page load.
+STATUS_CODE_LABELS: Dict[str, Dict[int, str]] = {
+    'en': {
+        1: 'Successful Interview',
+        2: 'Voicemail',
+        3: 'Call later (with time)',
+        4: 'Call later',
+        5: 'Busy',
+        6: 'No answer',
+        7: 'Incomplete interview (to be completed)',
+        8: 'Incomplete (respondent unwilling)',
+        9: 'Number not in network',
+        10: 'Language barrier',
+        11: 'Respondent unavailable during fieldwork',
+        12: 'Powered off',
+        13: 'Non‑cooperative',
+        14: 'Do not call again (angry)',
+        15: 'Not eligible',
+        16: 'Quota exceeded',
+        17: 'Unavailable',
+        18: 'Cannot connect',
+        19: 'Out of service',
+        20: 'Other',
+        21: 'Burned interview',
+    },
+    'fa': {
+        1: 'مصاحبه موفق',
+        2: 'پیغام گیر (صندوق صوتی)',
+        3: 'بعدا تماس بگیرید (با تعیین زمان)',
+        4: 'بعدا تماس بگیرید (بدون تعیین زمان)',
+        5: 'اشغال است',
+        6: 'جواب نمی‌دهد',
+        7: 'مصاحبه ناقص (باید تکمیل شود)',
+        8: 'مصاحبه ناقص (تمایلی به ادامه ندارد)',
+        9: 'شماره در شبکه موجود نیست',
+        10: 'مشکل زبان',
+        11: 'پاسخگو در مدت فیلد در دسترس نیست',
+        12: 'خاموش است',
+        13: 'عدم همکاری',
+        14: 'دیگر تماس نگیرید (پاسخگوی عصبانی)',
+        15: 'پاسخگوی غیر واجد شرایط',
+        16: 'بیش از سهمیه',
+        17: 'در دسترس نیست',
+        18: 'برقراری تماس مقدور نیست',
+        19: 'خارج از سرویس',
+        20: 'سایر',
+        21: 'مصاحبه سوخته',
+    },
+}
+
+
 def register(request: HttpRequest) -> HttpResponse:
     """Handle user registration.
 
@@ -203,6 +257,10 @@ def log_activity(user: User, action: str, details: str = '') -> None:
         pass
 
 
+_NON_IDENTIFIER_RE = re.compile(r'[^A-Za-z0-9_]+')
+
+
+@lru_cache(maxsize=256)
 def _sanitize_identifier(name: str) -> str:
     """Sanitise a string into a valid PostgreSQL identifier.
 
@@ -216,8 +274,11 @@ def _sanitize_identifier(name: str) -> str:
 
     Returns:
         A lowercase identifier safe for use in SQL identifiers.
+
+    The function is pure and sees a small set of asset IDs, so results
+    are memoised.
     """
-    cleaned = re.sub(r'[^A-Za-z0-9_]+', '_', str(name)).lower()
+    cleaned = _NON_IDENTIFIER_RE.sub('_', str(name)).lower()
     if cleaned and cleaned[0].isdigit():
         cleaned = f"c_{cleaned}"
     return cleaned[:63]
@@ -260,10 +321,19 @@ def generate_call_samples(project: Project, replenish: bool = False) -> None:
     )
     exclude_mobiles: set[str] = assigned_mobiles | interviewed_mobiles
     current_year = timezone.now().year
+    # Count open samples for every quota cell in one grouped query rather
+    # than issuing a separate COUNT(*) per cell inside the loop.
+    open_counts: Dict[int, int] = {}
+    if replenish:
+        open_counts = {
+            row['quota_id']: row['open']
+            for row in CallSample.objects.filter(project=project, completed=False)
+            .values('quota_id').annotate(open=Count('id')).order_by()
+        }
 
     for q in quotas:
         desired = max(int(q.target_count) * 3, 0)
-        existing_open = CallSample.objects.filter(project=project, quota=q, completed=False).count()
+        existing_open = open_counts.get(q.pk, 0)
         if replenish:
             to_create = max(desired - existing_open, 0)
         else:
@@ -309,11 +379,15 @@ def generate_call_samples(project: Project, replenish: bool = False) -> None:
             continue
         random.shuffle(candidates)
         selected_ids = candidates[:to_create]
-        persons = Person.objects.filter(national_code__in=selected_ids).prefetch_related('mobiles')
+        # ``mobiles.first()`` would bypass the prefetch cache and issue one
+        # query per person, so the prefetched list is read directly.
+        persons = Person.objects.filter(national_code__in=selected_ids).prefetch_related(
+            Prefetch('mobiles', queryset=Mobile.objects.order_by('mobile'), to_attr='cached_mobiles')
+        )
         for person in persons:
-            mob = person.mobiles.first()
-            if not mob:
+            if not person.cached_mobiles:
                 continue
+            mob = person.cached_mobiles[0]
             CallSample.objects.create(
                 project=project,
                 quota=q,
@@ -327,20 +401,40 @@ def generate_call_samples(project: Project, replenish: bool = False) -> None:
             exclude_mobiles.add(mob.mobile)
 
 
-def _get_accessible_projects(user: User, panel: str | None = None) -> List[Project]:
-    """Return a list of projects accessible to the user.
+def _accessible_projects_qs(user: User, panel: str | None = None):
+    """Return a queryset of projects accessible to the user.
 
     If ``panel`` is provided, only projects where the user has that panel
-    permission are returned.  Organisation users see all projects for
-    which they have a membership (typically all that they created).
+    permission are included.
     """
     qs = Project.objects.filter(memberships__user=user)
     # If a specific panel permission is requested, filter projects by memberships where that flag is True.
     if panel:
         filter_kwargs = {f"memberships__{panel}": True}
         qs = qs.filter(**filter_kwargs)
+    return qs
+
+
+def _get_accessible_projects(user: User, panel: str | None = None) -> List[Project]:
+    """Return a list of projects accessible to the user.
+
+    If ``panel`` is provided, only projects where the user has that panel
+    permission are returned.  Organisation users see all projects for
+    which they have a membership (typically all that they created).
+    Projects are ordered by name, case-insensitively, in the database.
+    """
+    qs = _accessible_projects_qs(user, panel)
     # For organisations, return distinct projects; for individuals, the same applies but they will have only their memberships
-    return list(qs.distinct())
+    return list(qs.distinct().order_by(Lower('name')))
+
+
+def _get_accessible_project_ids(user: User, panel: str | None = None) -> List[int]:
+    """Return the IDs of the projects accessible to the user.
+
+    Cheaper than :func:`_get_accessible_projects` when only an ``IN``
+    filter is needed, as no ``Project`` instances are built.
+    """
+    return list(_accessible_projects_qs(user, panel).values_list('id', flat=True).distinct())
 
 
 @login_required
@@ -869,29 +963,7 @@ def telephone_interviewer(request: HttpRequest) -> HttpResponse:
                 person_mobile = call_sample.mobile.mobile if call_sample.mobile else None
                 quota_cell = call_sample.quota
     # status codes mapping for display in template
-    status_codes = {
-        1: 'مصاحبه موفق' if request.session.get('lang', 'en') == 'fa' else 'Successful Interview',
-        2: 'پیغام گیر (صندوق صوتی)' if request.session.get('lang', 'en') == 'fa' else 'Voicemail',
-        3: 'بعدا تماس بگیرید (با تعیین زمان)' if request.session.get('lang', 'en') == 'fa' else 'Call later (with time)',
-        4: 'بعدا تماس بگیرید (بدون تعیین زمان)' if request.session.get('lang', 'en') == 'fa' else 'Call later',
-        5: 'اشغال است' if request.session.get('lang', 'en') == 'fa' else 'Busy',
-        6: 'جواب نمی‌دهد' if request.session.get('lang', 'en') == 'fa' else 'No answer',
-        7: 'مصاحبه ناقص (باید تکمیل شود)' if request.session.get('lang', 'en') == 'fa' else 'Incomplete interview (to be completed)',
-        8: 'مصاحبه ناقص (تمایلی به ادامه ندارد)' if request.session.get('lang', 'en') == 'fa' else 'Incomplete (respondent unwilling)',
-        9: 'شماره در شبکه موجود نیست' if request.session.get('lang', 'en') == 'fa' else 'Number not in network',
-        10: 'مشکل زبان' if request.session.get('lang', 'en') == 'fa' else 'Language barrier',
-        11: 'پاسخگو در مدت فیلد در دسترس نیست' if request.session.get('lang', 'en') == 'fa' else 'Respondent unavailable during fieldwork',
-        12: 'خاموش است' if request.session.get('lang', 'en') == 'fa' else 'Powered off',
-        13: 'عدم همکاری' if request.session.get('lang', 'en') == 'fa' else 'Non‑cooperative',
-        14: 'دیگر تماس نگیرید (پاسخگوی عصبانی)' if request.session.get('lang', 'en') == 'fa' else 'Do not call again (angry)',
-        15: 'پاسخگوی غیر واجد شرایط' if request.session.get('lang', 'en') == 'fa' else 'Not eligible',
-        16: 'بیش از سهمیه' if request.session.get('lang', 'en') == 'fa' else 'Quota exceeded',
-        17: 'در دسترس نیست' if request.session.get('lang', 'en') == 'fa' else 'Unavailable',
-        18: 'برقراری تماس مقدور نیست' if request.session.get('lang', 'en') == 'fa' else 'Cannot connect',
-        19: 'خارج از سرویس' if request.session.get('lang', 'en') == 'fa' else 'Out of service',
-        20: 'سایر' if request.session.get('lang', 'en') == 'fa' else 'Other',
-        21: 'مصاحبه سوخته' if request.session.get('lang', 'en') == 'fa' else 'Burned interview',
-    }
+    status_codes = STATUS_CODE_LABELS['fa' if request.session.get('lang', 'en') == 'fa' else 'en']
     # Determine start time for the interview form: if a call sample is
     # presented, record the current server time in ISO format so that the
     # template can include it as a hidden field.  This timestamp will be
@@ -1163,15 +1235,38 @@ def activity_logs(request: HttpRequest) -> HttpResponse:
     """Display activity logs for organisation users.
 
     This view lists recent actions recorded via ``log_activity``.  Only
-    organisation users may access it.  A maximum of 500 recent log
-    entries is displayed to keep the page manageable.
+    organisation users may access it.  Logs are shown 500 at a time,
+    newest first.  Older pages are reached with a keyset ``cursor``
+    parameter of the form ``<iso timestamp>,<id>`` taken from the last
+    row of the previous page, so no ``COUNT(*)`` or ``OFFSET`` scan is
+    needed however deep the user pages.
     """
     user = request.user
     if not _user_is_organisation(user):
         messages.error(request, 'Access denied: only organisation accounts can view logs.')
         return redirect('home')
-    logs = ActivityLog.objects.select_related('user').all()[:500]
-    return render(request, 'activity_logs.html', {'logs': logs})
+    page_size = 500
+    logs_qs = ActivityLog.objects.select_related('user').order_by('-timestamp', '-id')
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            ts_str, id_str = cursor.rsplit(',', 1)
+            cur_ts = datetime.fromisoformat(ts_str)
+            cur_id = int(id_str)
+        except ValueError:
+            cur_id = None
+        # Ids outside the bigint range would fail in the database; a
+        # malformed cursor simply shows the newest page.
+        if cur_id is not None and 0 < cur_id < 2 ** 63:
+            logs_qs = logs_qs.filter(Q(timestamp__lt=cur_ts) | Q(timestamp=cur_ts, id__lt=cur_id))
+    # Fetch one extra row to learn whether an older page exists
+    logs = list(logs_qs[:page_size + 1])
+    next_cursor = None
+    if len(logs) > page_size:
+        logs = logs[:page_size]
+        last = logs[-1]
+        next_cursor = f"{last.timestamp.isoformat()},{last.pk}"
+    return render(request, 'activity_logs.html', {'logs': logs, 'next_cursor': next_cursor})
 
 
 ################################################################################
@@ -16,35 +16,511 @@ needed.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, time
+from functools import partial
+import hashlib
 import json
-from typing import Dict, List
+import tempfile
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
-from django.db.models import Count, Q, F
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.core.cache import cache
+from django.db.models import Case, Count, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Lower, TruncDate
+from django.http import FileResponse, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.gzip import gzip_page
 
-from .models import Interview, Project
+from .models import Interview, Mobile, Project
+from .signals import get_performance_version
 # Reuse helper functions from the main views module.  In addition to
-# _user_has_panel and _user_is_organisation we also import
-# _get_accessible_projects so we can filter interview data to only
+# _user_has_panel and _user_is_organisation we also import the
+# accessible-project helpers so we can filter interview data to only
 # projects the current user is permitted to view.
 from .views import (
     _user_has_panel,
     _user_is_organisation,
-    _get_accessible_projects,
+    _accessible_projects_qs,
+    _get_accessible_project_ids,
 )
 
 # Attempt to import openpyxl for Excel export
 try:
     import openpyxl  # type: ignore
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.chart import BarChart, Reference
+    from openpyxl.styles import Font, NamedStyle, PatternFill
+    from openpyxl.utils import get_column_letter
 except Exception:
     openpyxl = None  # type: ignore
 
+# XlsxWriter is optional; when present it is used for the export
+# because its constant-memory mode keeps only one row in RAM.
+try:
+    import xlsxwriter  # type: ignore
+except Exception:
+    xlsxwriter = None  # type: ignore
+
+# orjson is optional; it encodes the chart payload several times faster
+# than the standard library encoder behind JsonResponse.
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # type: ignore
+
+SUMMARY_HEADERS = ['User', 'Total Interviews', 'Successful Interviews']
+RAW_CALL_HEADERS = [
+    'DateTime', 'Project', 'Interviewer', 'Phone', 'Code', 'Status',
+    'City', 'Age', 'BirthYear', 'Gender', 'StartForm', 'EndForm'
+]
+# Per-row label lookups for the RawCalls sheet
+RAW_STATUS_LABELS = ('Success', 'Other')
+RAW_GENDER_LABELS = {False: 'M', True: 'F', None: ''}
+HEADER_COLOR = '4F81BD'
+# Header style primitives are immutable, so they are built once at import
+# and shared by every export rather than constructed per workbook.
+HEADER_FONT = Font(bold=True, color='FFFFFF') if openpyxl is not None else None
+HEADER_FILL = PatternFill('solid', fgColor=HEADER_COLOR) if openpyxl is not None else None
+# Column widths are clamped so one long value cannot blow up a sheet.
+MIN_COLUMN_WIDTH = 10
+MAX_COLUMN_WIDTH = 50
+# Raw rows sampled when sizing columns; the rest are not measured.
+WIDTH_SAMPLE_ROWS = 200
+# Interviews fetched per round trip when streaming the raw export.
+EXPORT_CHUNK_SIZE = 2000
+# Seconds an aggregated chart payload is served from the cache.
+PAYLOAD_CACHE_TTL = 60
+# Interviewer count above which success rates are computed with numpy.
+VECTORISE_THRESHOLD = 500
+
+
+def _cached_accessible_projects(request: HttpRequest) -> List[Project]:
+    """Return the projects visible on the performance panel for ``request``.
+
+    Only ``pk`` and ``name`` are loaded, as the dashboard renders nothing
+    else.  The result is memoised on the request object so helpers
+    handling the same request do not repeat the membership query.
+    """
+    attr = '_cp_projects'
+    if not hasattr(request, attr):
+        qs = _accessible_projects_qs(request.user, panel='collection_performance')
+        setattr(request, attr, list(qs.distinct().order_by(Lower('name')).only('pk', 'name')))
+    return getattr(request, attr)
+
+
+def _cached_accessible_project_ids(request: HttpRequest) -> List[int]:
+    """Return the IDs of the performance panel projects for ``request``.
+
+    Used where only a ``project__in`` filter is needed; memoised on the
+    request like :func:`_cached_accessible_projects`.
+    """
+    attr = '_cp_project_ids'
+    if not hasattr(request, attr):
+        setattr(request, attr, _get_accessible_project_ids(request.user, panel='collection_performance'))
+    return getattr(request, attr)
+
+
+def _parse_id_list(raw: str | None) -> List[int]:
+    """Parse a comma-separated list of IDs in a single pass.
+
+    Blank and non-numeric parts are skipped rather than discarding the
+    whole list, and duplicates are dropped while preserving order.
+    """
+    if not raw:
+        return []
+    ids: Dict[int, None] = {}
+    for part in raw.split(','):
+        try:
+            ids[int(part)] = None
+        except ValueError:
+            continue
+    return list(ids)
+
+
+def _payload_response(payload: Dict[str, Any], status: int = 200) -> HttpResponse:
+    """Serialise a chart payload, using orjson when it is installed."""
+    if orjson is None:
+        return JsonResponse(payload, status=status, json_dumps_params={'separators': (',', ':')})
+    return HttpResponse(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        content_type='application/json',
+        status=status,
+    )
+
+
+def _success_rates(totals: List[int], successes: List[int]) -> List[float]:
+    """Return success percentages rounded to two decimals.
+
+    Counts are integers, so the rate is computed in hundredths of a
+    percent with integer arithmetic (rounding half up) and converted to
+    a float once, avoiding a float division and ``round`` per row.
+    Large organisations can have thousands of interviewers; above
+    ``VECTORISE_THRESHOLD`` rows the same arithmetic runs with numpy in
+    a single vectorised pass.
+    """
+    if np is not None and len(totals) > VECTORISE_THRESHOLD:
+        total_arr = np.asarray(totals, dtype=np.int64)
+        success_arr = np.asarray(successes, dtype=np.int64)
+        safe_totals = np.where(total_arr > 0, total_arr, 1)
+        hundredths = (success_arr * 20000 + safe_totals) // (2 * safe_totals)
+        return (np.where(total_arr > 0, hundredths, 0) / 100).tolist()
+    return [
+        ((success * 20000 + total) // (2 * total)) / 100 if total else 0.0
+        for total, success in zip(totals, successes)
+    ]
+
+
+def _parse_filter_datetime(value: str | None) -> datetime | None:
+    """Parse a ``start_date``/``end_date`` filter value.
+
+    Accepts ISO 8601 datetimes (including the ``datetime-local`` inputs
+    on the dashboard and a trailing ``Z``) as well as bare dates, which
+    are taken as midnight.  Invalid values yield ``None``.
+    """
+    if not value:
+        return None
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is not None:
+                parsed = datetime.combine(day, time.min)
+    except ValueError:
+        return None
+    return parsed
+
+
+def _filter_interviews(request: HttpRequest, qs) -> Tuple[Any, int | None]:
+    """Apply the dashboard query parameters to an interview queryset.
+
+    Shared by the JSON data view and the Excel export so both read
+    ``start_date``, ``end_date``, ``project`` and ``users`` the same
+    way.  Interviews are limited to the user's accessible projects;
+    non-organisation users only ever see their own interviews, while
+    organisations may narrow the set with ``users``.  Invalid values are
+    ignored.  Returns the filtered queryset and the selected project ID,
+    if any.
+    """
+    user = request.user
+    start_dt = _parse_filter_datetime(request.GET.get('start_date'))
+    if start_dt is not None:
+        qs = qs.filter(created_at__gte=start_dt)
+    end_dt = _parse_filter_datetime(request.GET.get('end_date'))
+    if end_dt is not None:
+        qs = qs.filter(created_at__lte=end_dt)
+    project_id_str = (request.GET.get('project') or '').strip()
+    pid = int(project_id_str) if project_id_str.isdigit() else None
+    if pid is not None:
+        qs = qs.filter(project__id=pid)
+    qs = qs.filter(project__in=_cached_accessible_project_ids(request))
+    if not _user_is_organisation(user):
+        qs = qs.filter(user=user)
+    else:
+        ids = _parse_id_list(request.GET.get('users'))
+        if ids:
+            qs = qs.filter(user__id__in=ids)
+    return qs, pid
+
+
+def _build_chart_payload(qs, donut: bool = False) -> Dict[str, Any]:
+    """Aggregate filtered interviews into the dashboard chart payload.
+
+    A single ``GROUP BY`` over (interviewer, day) feeds every chart:
+    the per-interviewer bar totals, the donut and the daily trend are
+    all folded from the same rows in Python, so the filtered interview
+    set is scanned once per request instead of once per chart.  The
+    donut is only populated when ``donut`` is true (i.e. a project has
+    been selected).
+    """
+    rows = qs.annotate(day=TruncDate('created_at')).values_list('user__first_name', 'day').annotate(
+        total=Count('id'),
+        success=Count('id', filter=Q(code=1)),
+    ).order_by()
+    per_user: Dict[Any, List[int]] = {}
+    per_day: Dict[Any, List[int]] = {}
+    # Grand totals are accumulated from the same grouped rows, so they
+    # cost no extra query and do not depend on the chart buckets.
+    total_interviews = 0
+    successful_interviews = 0
+    # Rows are plain (name, day, total, success) tuples, unpacked
+    # directly rather than looked up by key.
+    for name, day, total, success in rows:
+        total_interviews += total
+        successful_interviews += success
+        user_bucket = per_user.setdefault(name, [0, 0])
+        user_bucket[0] += total
+        user_bucket[1] += success
+        day_bucket = per_day.setdefault(day, [0, 0])
+        day_bucket[0] += total
+        day_bucket[1] += success
+    # Bar chart: one entry per interviewer, busiest first
+    bar_rows = sorted(
+        ((name or str(name), total, success) for name, (total, success) in per_user.items()),
+        key=lambda r: (-r[1], r[0]),
+    )
+    # Bar series and the top interviewer table come from the same rows
+    labels: List[str] = [r[0] for r in bar_rows]
+    totals: List[int] = [r[1] for r in bar_rows]
+    successes: List[int] = [r[2] for r in bar_rows]
+    top_all = [
+        {'user': label, 'total': total_count, 'success': success_count, 'rate': rate}
+        for label, total_count, success_count, rate in zip(
+            labels, totals, successes, _success_rates(totals, successes)
+        )
+    ]
+    # Donut chart: contributions per interviewer for the selected
+    # project, which is exactly the bar totals of the filtered set
+    donut_data: Dict[str, List] = {'labels': [], 'values': []}
+    if donut:
+        donut_data['labels'] = list(labels)
+        donut_data['values'] = list(totals)
+    # Daily trend: group by date
+    daily: Dict[str, List] = {'labels': [], 'totals': [], 'successes': []}
+    for day, (total, success) in sorted(per_day.items()):
+        daily['labels'].append(day.isoformat() if hasattr(day, 'isoformat') else str(day))
+        daily['totals'].append(total)
+        daily['successes'].append(success)
+    return {
+        'labels': labels,
+        'totals': totals,
+        'successes': successes,
+        'donut': donut_data,
+        'daily': daily,
+        # Already ranked by total descending; the client may re-sort
+        'top5_all': top_all,
+        'total_interviews': total_interviews,
+        'successful_interviews': successful_interviews,
+    }
+
+
+def _raw_call_rows(qs, tally: Optional[Dict[str, List[int]]] = None) -> Iterator[List[Any]]:
+    """Yield one RawCalls sheet row per interview in ``qs``.
+
+    When ``tally`` is given, per-interviewer ``[total, success]`` counts
+    are accumulated into it as the rows stream past, so the Summary
+    sheet can be built without a second scan of the same interviews.
+
+    The person's first mobile number is fetched by a correlated subquery
+    rather than one ``mobiles.first()`` query per row, and the rows are
+    streamed from the database cursor in chunks instead of being cached
+    on the queryset.  Rows are fetched as plain tuples of the written
+    columns, so no ``Interview``, ``Project`` or ``User`` instances are
+    built.
+    """
+    first_mobile = Mobile.objects.filter(person=OuterRef('person_id')).order_by('mobile').values('mobile')[:1]
+    rows = (
+        qs.annotate(
+            phone=Subquery(first_mobile),
+            # Resolve the Success/Other outcome in SQL as an index into
+            # RAW_STATUS_LABELS rather than branching per row in Python
+            outcome=Case(
+                When(Q(code=1) | Q(status=True), then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            ),
+        )
+        .order_by('created_at')
+        .values_list(
+            'created_at', 'project__name', 'user__first_name', 'phone', 'code', 'outcome',
+            'city', 'age', 'birth_year', 'gender', 'start_form', 'end_form',
+        )
+    )
+    for (created_at, project_name, first_name, phone, code, outcome, city, age,
+         birth_year, gender, start_form, end_form) in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        if tally is not None:
+            bucket = tally.setdefault(first_name or '', [0, 0])
+            bucket[0] += 1
+            if code == 1:
+                bucket[1] += 1
+        status_str = RAW_STATUS_LABELS[outcome]
+        # Prepare start and end form timestamps as ISO strings, fallback to empty string
+        start_form_str = start_form.isoformat(sep=' ') if start_form else ''
+        end_form_str = end_form.isoformat(sep=' ') if end_form else ''
+        yield [
+            created_at.isoformat(sep=' '),
+            project_name,
+            first_name or '',
+            phone or '',
+            code,
+            status_str,
+            city or '',
+            age if age is not None else '',
+            birth_year if birth_year is not None else '',
+            RAW_GENDER_LABELS[gender],
+            start_form_str,
+            end_form_str,
+        ]
+
+
+def _summary_from_tally(tally: Dict[str, List[int]]) -> List[List[Any]]:
+    """Return Summary rows from counts gathered by :func:`_raw_call_rows`."""
+    return sorted([name, total, success] for name, (total, success) in tally.items())
+
+
+def _summary_from_db(qs) -> List[List[Any]]:
+    """Return Summary rows from a grouped aggregate over ``qs``."""
+    agg = qs.values_list('user__first_name').annotate(
+        total=Count('id'),
+        success=Count('id', filter=Q(code=1))
+    ).order_by()
+    # One row per interviewer is few enough to sort in Python, which
+    # spares the database a sort step after the hash aggregate.
+    return sorted(
+        ([name or '', total, success] for name, total, success in agg),
+        key=itemgetter(0),
+    )
+
+
+def _track_widths(widths: List[int], row: List[Any]) -> None:
+    """Widen ``widths`` in place to fit the values of ``row``."""
+    for idx, value in enumerate(row):
+        length = len(str(value)) if value is not None else 0
+        if length > widths[idx]:
+            widths[idx] = length
+
+
+def _clamp_width(length: int) -> int:
+    return max(MIN_COLUMN_WIDTH, min(length + 2, MAX_COLUMN_WIDTH))
+
+
+def _write_export_openpyxl(
+    target,
+    raw_rows: Optional[Iterable[List[Any]]],
+    summary: Callable[[], List[List[Any]]],
+) -> None:
+    """Write the export workbook into the file object ``target`` using openpyxl.
+
+    A write-only workbook is used: rows are serialised as they are
+    appended instead of being kept around as Cell objects, so memory
+    stays flat no matter how many raw calls are exported.  The
+    RawCalls sheet is omitted when ``raw_rows`` is None.  ``summary`` is
+    only called once the raw rows have been written, so it may use
+    counts gathered while they streamed.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    # One named style is registered for every header cell instead of
+    # building Font/Fill objects per cell.
+    header_style = NamedStyle(name='hdr', font=HEADER_FONT, fill=HEADER_FILL)
+    wb.add_named_style(header_style)
+
+    def header_row(ws, headers: List[str]) -> List[Any]:
+        cells = []
+        for text in headers:
+            cell = WriteOnlyCell(ws, value=text)
+            cell.style = 'hdr'
+            cells.append(cell)
+        return cells
+
+    # Create the Summary sheet first so it stays the first tab, even
+    # though it is filled in last.
+    ws_summary = wb.create_sheet(title='Summary')
+    if raw_rows is not None:
+        # Raw calls sheet.  The rows are streamed, so their widths cannot be
+        # measured up front; size the columns from the headers instead.
+        ws_raw = wb.create_sheet(title='RawCalls')
+        # Keep the header visible; write-only sheets need this before the first row
+        ws_raw.freeze_panes = 'A2'
+        for idx, header in enumerate(RAW_CALL_HEADERS, start=1):
+            ws_raw.column_dimensions[get_column_letter(idx)].width = _clamp_width(len(header))
+        ws_raw.append(header_row(ws_raw, RAW_CALL_HEADERS))
+        for row in raw_rows:
+            ws_raw.append(row)
+    summary_rows = summary()
+    # Write-only sheets emit column dimensions with the first row, so
+    # widths must be known before anything is appended.
+    widths = [len(h) for h in SUMMARY_HEADERS]
+    for row in summary_rows:
+        _track_widths(widths, row)
+    for idx, width in enumerate(widths, start=1):
+        ws_summary.column_dimensions[get_column_letter(idx)].width = _clamp_width(width)
+    ws_summary.append(header_row(ws_summary, SUMMARY_HEADERS))
+    for row in summary_rows:
+        ws_summary.append(row)
+    # Build bar chart on Summary sheet.  Write-only sheets cannot be
+    # read back, so the data range comes from the rows written above.
+    last_row = len(summary_rows) + 1
+    chart = BarChart()
+    chart.title = 'Interview Performance'
+    chart.x_axis.title = 'User'
+    chart.y_axis.title = 'Count'
+    data_ref = Reference(ws_summary, min_col=2, min_row=1, max_col=3, max_row=last_row)
+    cat_ref = Reference(ws_summary, min_col=1, min_row=2, max_row=last_row)
+    chart.add_data(data_ref, titles_from_data=True)
+    chart.set_categories(cat_ref)
+    chart.width = 20
+    chart.height = 10
+    ws_summary.add_chart(chart, 'E2')
+    wb.save(target)
+
+
+def _write_export_xlsxwriter(
+    target,
+    raw_rows: Optional[Iterable[List[Any]]],
+    summary: Callable[[], List[List[Any]]],
+) -> None:
+    """Write the export workbook into the file object ``target`` using XlsxWriter.
+
+    ``constant_memory`` flushes each row to a temporary file once the
+    next row is started, so the RawCalls sheet costs O(1) memory
+    regardless of how many interviews are exported.  Rows must
+    therefore be written strictly in order within each sheet.  The
+    RawCalls sheet is omitted when ``raw_rows`` is None.  ``summary`` is
+    only called once the raw rows have been written, so it may use
+    counts gathered while they streamed.
+    """
+    # ZIP64 lets very large raw exports exceed the 4GB zip member limit
+    wb = xlsxwriter.Workbook(target, {'constant_memory': True, 'in_memory': False, 'use_zip64': True})
+    header_fmt = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#' + HEADER_COLOR})
+    # Create the Summary sheet first so it stays the first tab, even
+    # though it is filled in last.
+    ws_summary = wb.add_worksheet('Summary')
+    if raw_rows is not None:
+        ws_raw = wb.add_worksheet('RawCalls')
+        ws_raw.freeze_panes(1, 0)
+        ws_raw.write_row(0, 0, RAW_CALL_HEADERS, header_fmt)
+        # Widths are measured on the first rows only and applied once at the
+        # end; column settings are kept outside the flushed row data.
+        widths = [len(h) for h in RAW_CALL_HEADERS]
+        for row_idx, row in enumerate(raw_rows, start=1):
+            ws_raw.write_row(row_idx, 0, row)
+            if row_idx <= WIDTH_SAMPLE_ROWS:
+                _track_widths(widths, row)
+        for idx, width in enumerate(widths):
+            ws_raw.set_column(idx, idx, _clamp_width(width))
+    summary_rows = summary()
+    ws_summary.write_row(0, 0, SUMMARY_HEADERS, header_fmt)
+    widths = [len(h) for h in SUMMARY_HEADERS]
+    for row_idx, row in enumerate(summary_rows, start=1):
+        ws_summary.write_row(row_idx, 0, row)
+        _track_widths(widths, row)
+    for idx, width in enumerate(widths):
+        ws_summary.set_column(idx, idx, _clamp_width(width))
+    if summary_rows:
+        last_row = len(summary_rows)
+        chart = wb.add_chart({'type': 'column'})
+        for col in (1, 2):
+            chart.add_series({
+                'name': ['Summary', 0, col],
+                'categories': ['Summary', 1, 0, last_row, 0],
+                'values': ['Summary', 1, col, last_row, col],
+            })
+        chart.set_title({'name': 'Interview Performance'})
+        chart.set_x_axis({'name': 'User'})
+        chart.set_y_axis({'name': 'Count'})
+        # Match the 20cm x 10cm chart produced by the openpyxl writer
+        chart.set_size({'width': 756, 'height': 378})
+        ws_summary.insert_chart('E2', chart)
+    wb.close()
+
 
 @login_required
 def collection_performance(request: HttpRequest) -> HttpResponse:
@@ -63,21 +539,26 @@ def collection_performance(request: HttpRequest) -> HttpResponse:
     # Determine accessible projects: organisations see all their
     # membership projects; individuals see only their own.
     # Build the list of projects for which the user has the collection_performance panel permission.
-    accessible_projects = _get_accessible_projects(user, panel='collection_performance')
+    accessible_projects = _cached_accessible_projects(request)
     # Determine which interviewers to display: organisation users can see members of these projects; individual users see themselves.
     if _user_is_organisation(user):
-        users_qs = User.objects.filter(memberships__project__in=accessible_projects).distinct()
+        users_qs = User.objects.filter(
+            memberships__project__in=[p.pk for p in accessible_projects]
+        ).distinct()
     else:
         users_qs = User.objects.filter(pk=user.pk)
     context = {
-        'projects': sorted(accessible_projects, key=lambda p: p.name),
-        'users': users_qs.order_by('first_name'),
+        # Already ordered by name in _cached_accessible_projects
+        'projects': accessible_projects,
+        # The template only needs the option value and label
+        'users': users_qs.only('pk', 'first_name').order_by('first_name'),
     }
     return render(request, 'collection_performance.html', context)
 
 
 @login_required
-def collection_performance_data(request: HttpRequest) -> JsonResponse:
+@gzip_page
+def collection_performance_data(request: HttpRequest) -> HttpResponse:
     """Return aggregated interview statistics for performance charts.
 
     Accepts optional query parameters:
@@ -100,118 +581,50 @@ def collection_performance_data(request: HttpRequest) -> JsonResponse:
     ``totals``, ``successes``), the donut chart (``donut`` with
     ``labels`` and ``values``), the daily trend line (``daily`` with
     ``labels``, ``totals`` and ``successes``) and a list of top
-    interviewers (``top5_all``) sorted descending by total interviews.
-    The client is responsible for choosing which subset of the top
+    interviewers (``top5_all``) sorted descending by total interviews,
+    plus the overall ``total_interviews`` and ``successful_interviews``
+    counts for the filtered set.  The client is responsible for choosing which subset of the top
     interviewers to display.
     """
     user = request.user
     if not _user_has_panel(user, 'collection_performance'):
-        return JsonResponse({'error': 'forbidden'}, status=403)
-
-    # Parse filters from query parameters
-    start_date_str: str | None = request.GET.get('start_date')
-    end_date_str: str | None = request.GET.get('end_date')
-    project_id_str: str | None = request.GET.get('project')
-    user_ids_param: str | None = request.GET.get('users')
-    # Start with all interviews and filter down based on access permissions.
-    qs = Interview.objects.all()
-    # Filter by date range
-    if start_date_str:
-        try:
-            start_dt = datetime.fromisoformat(start_date_str)
-            qs = qs.filter(created_at__gte=start_dt)
-        except ValueError:
-            pass
-    if end_date_str:
-        try:
-            end_dt = datetime.fromisoformat(end_date_str)
-            qs = qs.filter(created_at__lte=end_dt)
-        except ValueError:
-            pass
-    # Filter by project if specified
-    if project_id_str:
-        try:
-            pid = int(project_id_str)
-            qs = qs.filter(project__id=pid)
-        except ValueError:
-            pass
+        return _payload_response({'error': 'forbidden'}, status=403)
+
     # Restrict by membership: only include interviews from projects where the user has the collection_performance permission.
-    accessible_projects = _get_accessible_projects(user, panel='collection_performance')
-    if accessible_projects:
-        qs = qs.filter(project__in=accessible_projects)
-    else:
+    accessible_ids = _cached_accessible_project_ids(request)
+    if not accessible_ids:
         # No accessible projects: return empty result early
-        return JsonResponse({
+        return _payload_response({
             'labels': [], 'totals': [], 'successes': [],
             'donut': {'labels': [], 'values': []},
             'daily': {'labels': [], 'totals': [], 'successes': []},
-            'top5_all': []
+            'top5_all': [],
+            'total_interviews': 0, 'successful_interviews': 0,
         })
-    # Restrict to current user if not organisation
-    if not _user_is_organisation(user):
-        qs = qs.filter(user=user)
-    else:
-        # Filter by selected user IDs if provided
-        if user_ids_param:
-            try:
-                ids = [int(i) for i in user_ids_param.split(',') if i.strip()]
-                qs = qs.filter(user__id__in=ids)
-            except ValueError:
-                pass
-    # Aggregate for bar chart: count per user
-    bar_agg = qs.values('user__first_name').annotate(
-        total=Count('id'),
-        success=Count('id', filter=Q(code=1))
-    ).order_by('-total')
-    labels: List[str] = []
-    totals: List[int] = []
-    successes: List[int] = []
-    for row in bar_agg:
-        labels.append(row['user__first_name'] or str(row['user__first_name']))
-        totals.append(row['total'])
-        successes.append(row['success'])
-    # Donut chart: contributions per interviewer for selected project
-    donut: Dict[str, List] = {'labels': [], 'values': []}
-    if project_id_str:
-        qs_donut = qs  # already filtered by project
-        donut_agg = qs_donut.values('user__first_name').annotate(
-            total=Count('id')
-        ).order_by('-total')
-        donut['labels'] = [row['user__first_name'] or str(row['user__first_name']) for row in donut_agg]
-        donut['values'] = [row['total'] for row in donut_agg]
-    # Daily trend: group by date
-    daily: Dict[str, List] = {'labels': [], 'totals': [], 'successes': []}
-    daily_agg = qs.annotate(day=F('created_at__date')).values('day').annotate(
-        total=Count('id'),
-        success=Count('id', filter=Q(code=1))
-    ).order_by('day')
-    for row in daily_agg:
-        day_str = row['day'].isoformat() if hasattr(row['day'], 'isoformat') else str(row['day'])
-        daily['labels'].append(day_str)
-        daily['totals'].append(row['total'])
-        daily['successes'].append(row['success'])
-    # Full ranking of interviewers for top5 table
-    top_all = []
-    for row in bar_agg:
-        total_count = row['total']
-        success_count = row['success']
-        rate = float(success_count) / total_count if total_count else 0.0
-        top_all.append({
-            'user': row['user__first_name'] or str(row['user__first_name']),
-            'total': total_count,
-            'success': success_count,
-            'rate': round(rate * 100.0, 2),
-        })
-    # Sort by total descending for top table; client may re‑sort
-    top_all_sorted = sorted(top_all, key=lambda x: (-x['total'], x['user']))
-    return JsonResponse({
-        'labels': labels,
-        'totals': totals,
-        'successes': successes,
-        'donut': donut,
-        'daily': daily,
-        'top5_all': top_all_sorted,
-    })
+    qs, pid = _filter_interviews(request, Interview.objects.all())
+    # The payload only depends on the filters, the requesting user and
+    # the interview data, so identical requests within the TTL are
+    # served from the cache.  The key embeds the version stamps of the
+    # projects in scope, which are bumped whenever one of their
+    # interviews is saved or deleted.
+    scope_ids = [p for p in accessible_ids if pid is None or p == pid]
+    filters = {
+        'start_date': request.GET.get('start_date'),
+        'end_date': request.GET.get('end_date'),
+        'project': pid,
+        'users': request.GET.get('users'),
+        'versions': get_performance_version(scope_ids),
+    }
+    digest = hashlib.sha1(
+        json.dumps(filters, sort_keys=True).encode() + str(user.id).encode()
+    ).hexdigest()
+    cache_key = f'cp:{digest}'
+    payload = cache.get_or_set(
+        cache_key,
+        lambda: _build_chart_payload(qs, donut=pid is not None),
+        PAYLOAD_CACHE_TTL,
+    )
+    return _payload_response(payload)
 
 
 @login_required
@@ -227,120 +640,58 @@ def collection_performance_export(request: HttpRequest) -> HttpResponse:
         the selected filters, listing the date/time, project name,
         interviewer, respondent phone number, code and other fields.
 
-    Accepts the same query parameters as ``collection_performance_data``.
+    Accepts the same query parameters as ``collection_performance_data``,
+    plus ``include_raw``: pass ``0`` to leave out the ``RawCalls`` sheet.
     Users without the ``collection_performance`` panel permission are
-    redirected to the home page with an error message.  If
-    ``openpyxl`` is not available, a 501 response is returned.
+    redirected to the home page with an error message.  If neither
+    ``xlsxwriter`` nor ``openpyxl`` is available, a 501 response is
+    returned.  When no interviews match the filters the user is sent
+    back to the dashboard with a message instead of an empty workbook.
     """
     user = request.user
     if not _user_has_panel(user, 'collection_performance'):
         messages.error(request, 'Access denied: you do not have collection performance permissions.')
         return redirect('home')
-    if openpyxl is None:
+    if openpyxl is None and xlsxwriter is None:
         return JsonResponse({'error': 'Excel export is not available on this server.'}, status=501)
-    # Extract filters
-    start_date_str: str | None = request.GET.get('start_date')
-    end_date_str: str | None = request.GET.get('end_date')
-    project_id_str: str | None = request.GET.get('project')
-    user_ids_param: str | None = request.GET.get('users')
-    qs = Interview.objects.select_related('project', 'user', 'person').all()
-    if start_date_str:
-        try:
-            start_dt = datetime.fromisoformat(start_date_str)
-            qs = qs.filter(created_at__gte=start_dt)
-        except ValueError:
-            pass
-    if end_date_str:
-        try:
-            end_dt = datetime.fromisoformat(end_date_str)
-            qs = qs.filter(created_at__lte=end_dt)
-        except ValueError:
-            pass
-    if project_id_str:
-        try:
-            pid = int(project_id_str)
-            qs = qs.filter(project__id=pid)
-        except ValueError:
-            pass
-    if not _user_is_organisation(user):
-        qs = qs.filter(user=user)
+    accessible_ids = _cached_accessible_project_ids(request)
+    qs, _pid = _filter_interviews(request, Interview.objects.all())
+    # Nothing matches the filters: skip the aggregation and workbook build
+    if not accessible_ids or not qs.exists():
+        messages.info(request, 'No interviews match the selected filters; nothing to export.')
+        return redirect('collection_performance')
+    # Write the workbook to an anonymous temporary file and stream it
+    # from disk, so the finished xlsx is never held in memory (let alone
+    # copied from a BytesIO into the response).  XlsxWriter is preferred
+    # when installed because its constant-memory mode flushes every row
+    # to disk as it is written; openpyxl's write-only mode is the
+    # fallback.
+    tmp = tempfile.TemporaryFile(suffix='.xlsx')
+    # The raw sheet is by far the most expensive part; callers that only
+    # need the summary can pass include_raw=0 to skip it entirely.  When
+    # it is included, the Summary counts are tallied from the streamed
+    # raw rows so the interviews are scanned once; otherwise they come
+    # from a grouped aggregate.
+    if request.GET.get('include_raw') == '0':
+        raw_rows = None
+        summary = partial(_summary_from_db, qs)
     else:
-        if user_ids_param:
-            try:
-                ids = [int(i) for i in user_ids_param.split(',') if i.strip()]
-                qs = qs.filter(user__id__in=ids)
-            except ValueError:
-                pass
-    # Only include interviews from projects where the current user has collection_performance permission.
-    accessible_projects = _get_accessible_projects(user, panel='collection_performance')
-    qs = qs.filter(project__in=accessible_projects)
-    # Aggregate summary
-    agg = qs.values('user__first_name').annotate(
-        total=Count('id'),
-        success=Count('id', filter=Q(code=1))
-    ).order_by('user__first_name')
-    # Prepare workbook
-    wb = openpyxl.Workbook()
-    ws_summary = wb.active
-    ws_summary.title = 'Summary'
-    ws_summary.append(['User', 'Total Interviews', 'Successful Interviews'])
-    for row in agg:
-        ws_summary.append([
-            row['user__first_name'] or '',
-            row['total'],
-            row['success'],
-        ])
-    # Build bar chart on Summary sheet
-    chart = BarChart()
-    chart.title = 'Interview Performance'
-    chart.x_axis.title = 'User'
-    chart.y_axis.title = 'Count'
-    data_ref = Reference(ws_summary, min_col=2, min_row=1, max_col=3, max_row=ws_summary.max_row)
-    cat_ref = Reference(ws_summary, min_col=1, min_row=2, max_row=ws_summary.max_row)
-    chart.add_data(data_ref, titles_from_data=True)
-    chart.set_categories(cat_ref)
-    chart.width = 20
-    chart.height = 10
-    ws_summary.add_chart(chart, 'E2')
-    # Raw calls sheet
-    ws_raw = wb.create_sheet(title='RawCalls')
-    ws_raw.append([
-        'DateTime', 'Project', 'Interviewer', 'Phone', 'Code', 'Status',
-        'City', 'Age', 'BirthYear', 'Gender', 'StartForm', 'EndForm'
-    ])
-    for iv in qs.order_by('created_at'):
-        # Determine phone number: first mobile of the person if available
-        phone = ''
-        if iv.person and hasattr(iv.person, 'mobiles'):
-            mob = iv.person.mobiles.first()
-            if mob:
-                phone = mob.mobile
-        status_str = 'Success' if (iv.code == 1 or iv.status) else 'Other'
-        # Prepare start and end form timestamps as ISO strings, fallback to empty string
-        start_form_str = iv.start_form.isoformat(sep=' ') if iv.start_form else ''
-        end_form_str = iv.end_form.isoformat(sep=' ') if iv.end_form else ''
-        ws_raw.append([
-            iv.created_at.isoformat(sep=' '),
-            iv.project.name,
-            iv.user.first_name or '',
-            phone,
-            iv.code,
-            status_str,
-            iv.city or '',
-            iv.age if iv.age is not None else '',
-            iv.birth_year if iv.birth_year is not None else '',
-            ('M' if iv.gender is False else 'F') if iv.gender is not None else '',
-            start_form_str,
-            end_form_str,
-        ])
-    # Write to HTTP response
-    from io import BytesIO
-    buffer = BytesIO()
-    wb.save(buffer)
-    buffer.seek(0)
-    response = HttpResponse(
-        buffer.read(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        tally: Dict[str, List[int]] = {}
+        raw_rows = _raw_call_rows(qs, tally)
+        summary = partial(_summary_from_tally, tally)
+    try:
+        if xlsxwriter is not None:
+            _write_export_xlsxwriter(tmp, raw_rows, summary)
+        else:
+            _write_export_openpyxl(tmp, raw_rows, summary)
+    except Exception:
+        tmp.close()
+        raise
+    tmp.seek(0)
+    # FileResponse streams the file in blocks and closes it when done
+    return FileResponse(
+        tmp,
+        as_attachment=True,
+        filename='collection_performance.xlsx',
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
     )
-    response['Content-Disposition'] = 'attachment; filename=collection_performance.xlsx'
-    return response
\ No newline at end of file
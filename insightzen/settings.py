@@ -14,15 +14,41 @@ from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
+CORE_DIR = BASE_DIR / 'core'
+
+# Accepted spellings for boolean environment variables
+_TRUTHY = frozenset({'true', '1', 'yes', 'on'})
+_FALSY = frozenset({'false', '0', 'no', 'off'})
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment.
+
+    Unset or unrecognised values fall back to ``default``.
+    """
+    value = os.getenv(name, '').strip().lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return default
 
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = 'django-insecure-CHANGE_ME_TO_A_RANDOM_SECRET_KEY'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Debug mode also keeps the text of every SQL query in memory for the
+# whole request, which is costly for large exports.  Set DJANGO_DEBUG=true
+# for local development.
+DEBUG = _env_bool('DJANGO_DEBUG')
 
-ALLOWED_HOSTS: list[str] = []
+# Comma-separated host names; defaults cover local development.  Hosts
+# are lower-cased and de-duplicated once here, as Django scans this
+# sequence for every request.
+ALLOWED_HOSTS: tuple[str, ...] = tuple(dict.fromkeys(
+    h.strip().lower() for h in os.getenv('DJANGO_ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',') if h.strip()
+))
 
 
 # Application definition
@@ -52,7 +78,7 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         # Look for templates in the core application's templates directory
-        'DIRS': [os.path.join(BASE_DIR, 'core', 'templates')],
+        'DIRS': [CORE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -83,15 +109,61 @@ DATABASES = {
         # Host and port for PostgreSQL connection
         'HOST': os.getenv('PGHOST', '127.0.0.1'),
         'PORT': os.getenv('PGPORT', '5432'),
-        # Keep connections open for a minute to improve performance for repeated queries
-        'CONN_MAX_AGE': 60,
+        # Keep connections open to avoid a TCP/TLS handshake per request;
+        # five minutes by default, overridable via PG_CONN_MAX_AGE
+        'CONN_MAX_AGE': int(os.getenv('PG_CONN_MAX_AGE', '300')),
+        # When PGHOST points at pgbouncer in transaction pooling mode,
+        # set PGBOUNCER=true: server-side cursors (used by .iterator())
+        # do not survive across pooled transactions.
+        'DISABLE_SERVER_SIDE_CURSORS': _env_bool('PGBOUNCER'),
+        # Verify reused persistent connections before handing them out
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             # Prefer encrypted connections; can be overridden via PGSSLMODE
             'sslmode': os.getenv('PGSSLMODE', 'prefer'),
+            # TCP keepalives stop NAT/firewall idle timeouts from
+            # silently dropping persistent connections
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 10,
+            'keepalives_count': 5,
         },
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+# Performance dashboard payloads are cached briefly.  Set REDIS_URL to
+# share the cache (and its invalidation stamp) across worker processes;
+# otherwise each process keeps its own in-memory cache.
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Sessions
+# https://docs.djangoproject.com/en/4.0/topics/http/sessions/
+# With a shared cache (REDIS_URL) session reads are served from the
+# cache and only fall back to the database on a miss.  A per-process
+# LocMemCache would let other workers keep accepting a session after it
+# is flushed, so without Redis sessions stay database-backed.  Signed
+# cookies are not used: the session holds pending registration data
+# that must stay server-side.
+SESSION_ENGINE = os.getenv(
+    'DJANGO_SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if REDIS_URL else 'django.contrib.sessions.backends.db',
+)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [
@@ -124,7 +196,7 @@ USE_TZ = True
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.0/howto/static-files/
 STATIC_URL = '/static/'
-STATICFILES_DIRS = [os.path.join(BASE_DIR, 'core', 'static')]
+STATICFILES_DIRS = [CORE_DIR / 'static']
 
 
 # Default primary key field type
@@ -133,4 +205,30 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Where Django should redirect after successful login
 LOGIN_REDIRECT_URL = 'home'
-LOGIN_URL = 'login'
\ No newline at end of file
+LOGIN_URL = 'login'
+
+
+# Logging
+# https://docs.djangoproject.com/en/4.0/topics/logging/
+# Console output only; Django itself logs at WARNING unless
+# DJANGO_LOG_LEVEL says otherwise.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['console'],
+            'level': os.getenv('DJANGO_LOG_LEVEL', 'WARNING'),
+            'propagate': False,
+        },
+    },
+}
@@ -32,21 +32,36 @@ Note: This module does not implement scheduling.  Use the
 
 from __future__ import annotations
 
-import argparse
+import atexit
+import csv
+import io
 import json
+import queue
 import re
+import threading
+import weakref
 import time
 import logging
 import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Tuple, Optional, Iterator
 
 import os
 import requests
-import pandas as pd  # type: ignore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import psycopg2  # type: ignore
 from psycopg2 import sql  # type: ignore
-from psycopg2.extras import execute_values  # type: ignore
+
+# orjson is optional; it decodes the API's JSON pages several times faster
+# than the standard library.
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -79,6 +94,41 @@ PG_PASSWORD: str = os.getenv('PG_PASSWORD', '123456789')
 RUN_NULL_AUDIT: bool = os.getenv('RUN_NULL_AUDIT', 'True').lower() not in ('false', '0', 'no')
 AUTO_DROP_EMPTY_DUP_REPEAT_COLS: bool = os.getenv('AUTO_DROP_EMPTY_DUP_REPEAT_COLS', 'True').lower() not in ('false', '0', 'no')
 
+# Submissions buffered before the main and repeat batches are flushed.
+MAIN_BATCH_SIZE: int = int(os.getenv('MAIN_BATCH_SIZE', '5000'))
+
+# Rows buffered per repeat table before it is flushed on its own.
+REPEAT_BATCH_SIZE: int = int(os.getenv('REPEAT_BATCH_SIZE', '5000'))
+
+# Main batches written per transaction; commits are amortised over
+# this many batches instead of one per table per batch.
+COMMIT_EVERY_BATCHES: int = int(os.getenv('COMMIT_EVERY_BATCHES', '10'))
+
+# Submissions requested per API page; lower it to cap memory on forms
+# with very large submissions.
+API_PAGE_SIZE: int = int(os.getenv('API_PAGE_SIZE', '1000'))
+
+# Submissions fetched ahead of the insert loop by a background thread, so
+# API downloads overlap with database writes; 0 disables read-ahead.
+PREFETCH_QUEUE_SIZE: int = int(os.getenv('PREFETCH_QUEUE_SIZE', '2000'))
+
+# Worker threads (each with its own connection) used to flush repeat
+# tables and run the post-load table checks in parallel; 1 runs them
+# serially on the main connection.
+REPEAT_FLUSH_WORKERS: int = int(os.getenv('REPEAT_FLUSH_WORKERS', '4'))
+
+# A main or repeat batch is also flushed once its estimated payload
+# reaches this many bytes, so wide forms do not build huge statements.
+BATCH_MAX_BYTES: int = int(os.getenv('BATCH_MAX_BYTES', str(8 * 1024 * 1024)))
+
+# Batches with at least this many rows are bulk loaded with COPY through a
+# temporary staging table; smaller batches use a multi-row INSERT.
+COPY_MIN_ROWS: int = int(os.getenv('COPY_MIN_ROWS', '500'))
+
+# Idle connections kept for reuse; ``run_once`` borrows its connections
+# from this pool instead of reconnecting on every run.
+ETL_POOL_MAX: int = int(os.getenv('ETL_POOL_MAX', '8'))
+
 # ---------------------------------------------------------------------------
 # Logging
 #
@@ -112,10 +162,31 @@ def verify_param() -> Any:
     """Return TLS verification parameter for requests."""
     return CUSTOM_CA if CUSTOM_CA else VERIFY_TLS
 
+# Sessions per API token, reused across ``run_once`` calls so that
+# keep-alive connections to the API survive between forms.
+_SESSIONS: Dict[str, requests.Session] = {}
+
 def kpi_session(api_token: str) -> requests.Session:
-    """Create a requests Session with the Authorization header."""
+    """Return a requests Session with the Authorization header.
+
+    Sessions are cached per token so pooled keep-alive connections are
+    reused.  TLS verification is passed on every request rather than set
+    on the session: requests lets ``REQUESTS_CA_BUNDLE``/``CURL_CA_BUNDLE``
+    override ``Session.verify``, which would silently replace ``CUSTOM_CA``
+    or ``VERIFY_TLS=False``.  Transient gateway errors are retried with
+    backoff.  requests already asks for
+    gzip/deflate responses, so JSON pages are compressed on the wire.
+    """
+    s = _SESSIONS.get(api_token)
+    if s is not None:
+        return s
     s = requests.Session()
     s.headers.update({"Authorization": f"Token {api_token}", "Accept": "application/json"})
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    _SESSIONS[api_token] = s
     return s
 
 def base_type(xls_type: str) -> str:
@@ -138,14 +209,18 @@ def map_xls_to_pg(xls_type: str) -> str:
         return "TIMESTAMP WITHOUT TIME ZONE"
     return "TEXT"
 
+_TRAIL_PUNCT_RE = re.compile(r"[\s,;؛،]+$")
+_NON_IDENT_RE = re.compile(r"[^A-Za-z0-9_]+")
+_LEADING_DIGIT_RE = re.compile(r"^[0-9]")
+
 def _norm_name(x: str) -> str:
-    return re.sub(r"[\s,;؛،]+$", "", str(x).strip())
+    return _TRAIL_PUNCT_RE.sub("", str(x).strip())
 
 def sanitize_identifier_raw(path: str) -> str:
     """Sanitise arbitrary strings into PostgreSQL-safe identifiers."""
     name = path.replace("/", "__")
-    name = re.sub(r"[^A-Za-z0-9_]+", "_", name)
-    if re.match(r"^[0-9]", name):
+    name = _NON_IDENT_RE.sub("_", name)
+    if _LEADING_DIGIT_RE.match(name):
         name = "c_" + name
     return name.lower()
 
@@ -153,10 +228,13 @@ def truncate_pg_ident(ident: str) -> str:
     if len(ident) <= PG_IDENT_MAX:
         return ident
     cut = ident[:PG_IDENT_MAX]
-    log.debug(f"[ident] truncated '{ident}' -> '{cut}'")
+    log.debug("[ident] truncated '%s' -> '%s'", ident, cut)
     return cut
 
+@lru_cache(maxsize=4096)
 def sanitize_identifier(path: str) -> str:
+    # Field paths come from a small per-form vocabulary but are sanitised
+    # for every key of every submission, so results are memoised.
     return truncate_pg_ident(sanitize_identifier_raw(path))
 
 def split_path(p: str) -> List[str]:
@@ -167,19 +245,30 @@ def split_path(p: str) -> List[str]:
 #
 def parse_xls_full_paths(xls_path: str) -> Tuple[List[Tuple[str, str]], Dict[str, List[Tuple[str, str]]]]:
     """Parse an XLSForm and return lists of (full_path, pg_type) pairs."""
+    # pandas is most of this module's import time and is only needed here,
+    # on a form cache miss.
+    import pandas as pd  # type: ignore
+
     xls = pd.ExcelFile(xls_path)
-    # Find a sheet with columns 'type' and 'name'
+    # Find a sheet with columns 'type' and 'name'; only header rows are
+    # read while probing.
     sheet_name = "survey"
     if sheet_name not in xls.sheet_names:
         chosen: Optional[str] = None
         for sh in xls.sheet_names:
-            df = xls.parse(sh)
+            df = xls.parse(sh, nrows=0)
             lc = [str(c).strip().lower() for c in df.columns]
             if "type" in lc and "name" in lc:
                 chosen = sh
                 break
         sheet_name = chosen or xls.sheet_names[0]
-    survey = xls.parse(sheet_name).fillna("")
+    # Only 'type' and 'name' are used, so skip every other column (labels,
+    # hints, constraints in each language ...).
+    survey = xls.parse(
+        sheet_name,
+        usecols=lambda c: str(c).strip().lower() in ("type", "name"),
+        dtype=str,
+    ).fillna("")
     survey.columns = [str(c).strip().lower() for c in survey.columns]
 
     stack: List[str] = []
@@ -191,9 +280,12 @@ def parse_xls_full_paths(xls_path: str) -> Tuple[List[Tuple[str, str]], Dict[str
     def current_path() -> str:
         return "/".join(stack) if stack else ""
 
-    for _, row in survey.iterrows():
-        typ = str(row.get("type", "")).strip()
-        nm = str(row.get("name", "")).strip()
+    blank = [""] * len(survey)
+    types = survey["type"].tolist() if "type" in survey.columns else blank
+    names = survey["name"].tolist() if "name" in survey.columns else blank
+    for typ, nm in zip(types, names):
+        typ = str(typ).strip()
+        nm = str(nm).strip()
         bt = base_type(typ)
 
         if bt == "begin_group":
@@ -251,20 +343,104 @@ def pg_connect() -> psycopg2.extensions.connection:
         psycopg2.extensions.connection: A new connection configured with
         the latest environment variables.
     """
-    # Resolve parameters from environment on every call.  Use defaults
-    # defined at module level if the environment variable is unset.
-    host = os.environ.get('PG_HOST', PG_HOST)
-    port = int(os.environ.get('PG_PORT', str(PG_PORT)))
-    dbname = os.environ.get('PG_DBNAME', PG_DBNAME)
-    user = os.environ.get('PG_USER', PG_USER)
-    password = os.environ.get('PG_PASSWORD', PG_PASSWORD)
-    return psycopg2.connect(
-        host=host,
-        port=port,
-        dbname=dbname,
-        user=user,
-        password=password,
-    )
+    return psycopg2.connect(**_pg_params())
+
+def _pg_params() -> Dict[str, Any]:
+    """Resolve the connection parameters from the environment at call time.
+
+    Missing environment variables fall back to the module-level defaults.
+    """
+    return {
+        'host': os.environ.get('PG_HOST', PG_HOST),
+        'port': int(os.environ.get('PG_PORT', str(PG_PORT))),
+        'dbname': os.environ.get('PG_DBNAME', PG_DBNAME),
+        'user': os.environ.get('PG_USER', PG_USER),
+        'password': os.environ.get('PG_PASSWORD', PG_PASSWORD),
+    }
+
+# Idle connections kept for reuse between runs, all opened with the
+# parameters in ``_POOL_KEY``.  Only one parameter set is pooled: when the
+# management command repoints PG_* the idle connections are closed, and
+# borrowed ones opened with the old parameters are closed on release.
+_POOL_LOCK = threading.Lock()
+_POOL_KEY: Optional[Tuple[Any, ...]] = None
+_POOL_IDLE: List[psycopg2.extensions.connection] = []
+# Parameter key each borrowed connection was opened with, by ``id(conn)``
+_POOL_BORROWED: Dict[int, Tuple[Any, ...]] = {}
+
+def _close_quietly(conns: List[psycopg2.extensions.connection]) -> None:
+    for conn in conns:
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+def close_pool() -> None:
+    """Close every idle pooled connection.
+
+    Connections currently borrowed are closed when they are released.
+    Call this before a process that ran the ETL exits or stops syncing.
+    """
+    global _POOL_KEY, _POOL_IDLE
+    with _POOL_LOCK:
+        idle, _POOL_IDLE = _POOL_IDLE, []
+        _POOL_KEY = None
+    _close_quietly(idle)
+
+atexit.register(close_pool)
+
+def _pg_acquire() -> psycopg2.extensions.connection:
+    """Borrow a live connection for the current parameters.
+
+    An idle pooled connection is reused when one passes a ``SELECT 1``
+    probe; otherwise a new one is opened.  Pass it to :func:`_pg_release`.
+    """
+    global _POOL_KEY, _POOL_IDLE
+    params = _pg_params()
+    key = tuple(sorted(params.items()))
+    while True:
+        stale: List[psycopg2.extensions.connection] = []
+        with _POOL_LOCK:
+            if key != _POOL_KEY:
+                stale, _POOL_IDLE = _POOL_IDLE, []
+                _POOL_KEY = key
+            conn = _POOL_IDLE.pop() if _POOL_IDLE else None
+        _close_quietly(stale)
+        if conn is None:
+            conn = psycopg2.connect(**params)
+            break
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            break
+        except psycopg2.Error:
+            # The server dropped an idle connection; discard it and retry.
+            _close_quietly([conn])
+    with _POOL_LOCK:
+        _POOL_BORROWED[id(conn)] = key
+    return conn
+
+def _pg_release(conn: psycopg2.extensions.connection) -> None:
+    """Return a connection obtained from :func:`_pg_acquire`.
+
+    Uncommitted work is rolled back so the next borrower starts clean.
+    The connection is closed instead of pooled when it is broken, was
+    opened for other parameters, or ``ETL_POOL_MAX`` are already idle.
+    """
+    _PENDING_COLS.pop(conn, None)
+    keep = not conn.closed
+    if keep:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            keep = False
+    with _POOL_LOCK:
+        key = _POOL_BORROWED.pop(id(conn), None)
+        if keep and key == _POOL_KEY and len(_POOL_IDLE) < ETL_POOL_MAX:
+            _POOL_IDLE.append(conn)
+            return
+    _close_quietly([conn])
 
 SYS_FIELDS_MAIN = [
     ("_id", "BIGINT"),
@@ -287,6 +463,7 @@ SYS_MAIN_SANITIZED = {sanitize_identifier(x) for x, _ in SYS_FIELDS_MAIN}
 
 def ensure_main_table(conn, table: str, main_cols: List[Tuple[str, str]]) -> None:
     """Create the main table if it does not exist."""
+    _KNOWN_COLS.pop(table, None)
     with conn.cursor() as cur:
         seen: set[str] = set()
         items: List[Any] = []
@@ -305,6 +482,7 @@ def ensure_main_table(conn, table: str, main_cols: List[Tuple[str, str]]) -> Non
 
 def ensure_repeat_table(conn, table: str, repeat_cols: List[Tuple[str, str]]) -> None:
     """Create a repeat table if it does not exist."""
+    _KNOWN_COLS.pop(table, None)
     with conn.cursor() as cur:
         seen: set[str] = set()
         items: List[Any] = []
@@ -324,11 +502,43 @@ def ensure_repeat_table(conn, table: str, repeat_cols: List[Tuple[str, str]]) ->
         )
     conn.commit()
 
-def add_missing_columns(conn, table: str, cols: List[str]) -> None:
-    """Ensure the given columns exist on a table (adding them as TEXT)."""
+# Committed column names per table, filled from information_schema on
+# first use so later batches do not repeat the catalog query.  Entries are
+# dropped when a run (re)creates a table or when columns are dropped.
+_KNOWN_COLS: Dict[str, set[str]] = {}
+
+# Columns added by each connection's open transaction.  They are merged
+# into ``_KNOWN_COLS`` by :func:`_commit` and discarded on rollback, so a
+# failed batch never leaves other runs believing the columns exist.
+_PENDING_COLS: "weakref.WeakKeyDictionary[Any, Dict[str, set[str]]]" = weakref.WeakKeyDictionary()
+
+def _commit(conn) -> None:
+    """Commit ``conn`` and publish the columns its transaction added."""
+    conn.commit()
+    for table, cols in _PENDING_COLS.pop(conn, {}).items():
+        known = _KNOWN_COLS.get(table)
+        if known is not None:
+            known.update(cols)
+
+def add_missing_columns(conn, table: str, cols: List[str], cur=None) -> bool:
+    """Ensure the given columns exist on a table (adding them as TEXT).
+
+    Returns True if an ALTER was issued.  The ALTER joins the caller's
+    transaction and holds an ACCESS EXCLUSIVE lock on the table until it
+    commits, so callers should commit promptly when this returns True;
+    :func:`run_once` does so right after the batch that needed the new
+    columns.  Added columns count as known to other connections only once
+    committed through :func:`_commit`.  Pass ``cur`` to reuse an open
+    cursor.
+    """
     if not cols:
-        return
-    with conn.cursor() as cur:
+        return False
+    if cur is None:
+        with conn.cursor() as cur:
+            return add_missing_columns(conn, table, cols, cur)
+    pending = _PENDING_COLS.get(conn, {}).get(table, set())
+    known = _KNOWN_COLS.get(table)
+    if known is None:
         cur.execute(
             """
             SELECT column_name FROM information_schema.columns
@@ -336,21 +546,28 @@ def add_missing_columns(conn, table: str, cols: List[str]) -> None:
             """,
             (table,),
         )
-        existing = {r[0] for r in cur.fetchall()}
-        new_cols: List[str] = []
-        for raw in cols:
-            candidate = sanitize_identifier(raw)
-            if candidate in existing:
-                continue
-            cur.execute(
-                sql.SQL("ALTER TABLE {} ADD COLUMN {} TEXT").format(
-                    sql.Identifier(table), sql.Identifier(candidate)
-                )
+        # This transaction's own uncommitted columns are not cached
+        known = _KNOWN_COLS[table] = {r[0] for r in cur.fetchall()} - pending
+    new_cols: List[str] = []
+    for raw in cols:
+        candidate = sanitize_identifier(raw)
+        if candidate in known or candidate in pending or candidate in new_cols:
+            continue
+        new_cols.append(candidate)
+    if new_cols:
+        # One ALTER for all new columns: a single lock and round-trip
+        cur.execute(
+            sql.SQL("ALTER TABLE {} {}").format(
+                sql.Identifier(table),
+                sql.SQL(", ").join(
+                    [sql.SQL("ADD COLUMN IF NOT EXISTS {} TEXT").format(sql.Identifier(c)) for c in new_cols]
+                ),
             )
-            new_cols.append(candidate)
-        if new_cols:
-            log.info(f"[db] added columns to {table}: {new_cols}")
-    conn.commit()
+        )
+        log.info("[db] added columns to %s: %s", table, new_cols)
+        _PENDING_COLS.setdefault(conn, {}).setdefault(table, set()).update(new_cols)
+        return True
+    return False
 
 def get_max_main_id(conn, table: str) -> int:
     """Return the maximum _id currently in the main table."""
@@ -359,45 +576,240 @@ def get_max_main_id(conn, table: str) -> int:
         (mx,) = cur.fetchone()
         return int(mx or 0)
 
+def _dump_json(v: Any) -> str:
+    return json.dumps(v, ensure_ascii=False)
+
+def _decode_bytes(v: Any) -> str:
+    try:
+        return v.decode("utf-8", errors="ignore")
+    except Exception:
+        return str(v)
+
+# Converters keyed by exact type; decoded JSON only produces these exact
+# container types, so one dict lookup replaces the isinstance chain.
+_NORMALIZERS = {dict: _dump_json, list: _dump_json, bytes: _decode_bytes, bytearray: _decode_bytes}
+
 def normalize_value(v: Any) -> Any:
     """Convert various types into database-storable values."""
     if v is None or v == "":
         return None
+    conv = _NORMALIZERS.get(type(v))
+    if conv is not None:
+        return conv(v)
+    # Subclasses (e.g. OrderedDict) still take the matching converter
     if isinstance(v, (dict, list)):
-        return json.dumps(v, ensure_ascii=False)
+        return _dump_json(v)
     if isinstance(v, (bytes, bytearray)):
-        try:
-            return v.decode("utf-8", errors="ignore")
-        except Exception:
-            return str(v)
+        return _decode_bytes(v)
     return v
 
-def to_sanitized_row(flat: Dict[str, Any]) -> Dict[str, Any]:
-    """Sanitise all keys in a dictionary and normalise values."""
-    return {sanitize_identifier(k): normalize_value(v) for k, v in flat.items()}
+def to_sanitized_row(
+    flat: Dict[str, Any],
+    _sanitize=sanitize_identifier,
+    _normalize=normalize_value,
+) -> Dict[str, Any]:
+    """Sanitise all keys in a dictionary and normalise values.
 
-def insert_many(conn, table: str, rows: List[Dict[str, Any]], conflict_cols: List[str]) -> None:
-    """Insert a batch of rows with ON CONFLICT DO NOTHING."""
-    if not rows:
+    Runs for every submission and repeat item: the helpers are bound as
+    defaults for fast local lookups, and plain strings (most values)
+    skip the ``normalize_value`` call.
+    """
+    row: Dict[str, Any] = {}
+    for k, v in flat.items():
+        if type(v) is str:
+            row[_sanitize(k)] = v or None
+        else:
+            row[_sanitize(k)] = _normalize(v)
+    return row
+
+def _row_bytes(row: Dict[str, Any]) -> int:
+    """Roughly estimate a row's payload: string lengths, 8 per other value."""
+    n = 0
+    for v in row.values():
+        if type(v) is str:
+            n += len(v)
+        elif v is not None:
+            n += 8
+    return n
+
+def _row_tuples(rows: List[Dict[str, Any]], cols: List[str]) -> Iterator[Tuple[Any, ...]]:
+    """Yield each row's values in ``cols`` order, with None for missing keys.
+
+    ``cols`` is the union of the rows' keys, so a row of the same length
+    already has every column and goes straight through ``itemgetter``.
+    """
+    ncols = len(cols)
+    if ncols == 1:
+        col = cols[0]
+        for r in rows:
+            yield (r.get(col),)
         return
+    get = itemgetter(*cols)
+    none_row = dict.fromkeys(cols)
+    for r in rows:
+        yield get(r) if len(r) == ncols else get({**none_row, **r})
+
+def _copy_value(v: Any) -> Any:
+    """Render a normalised value for CSV COPY input.
+
+    ``None`` becomes an unquoted empty field (NULL); booleans are spelt the
+    way PostgreSQL casts them to text, matching the INSERT path.
+    """
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    return v
+
+class _CopyReader:
+    """File-like COPY source that formats rows as CSV on demand.
+
+    ``copy_expert`` pulls the input in ``read(size)`` chunks, so only about
+    one chunk of CSV text exists at a time instead of the whole batch.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], cols: List[str]) -> None:
+        self._values = _row_tuples(rows, cols)
+        self._buf = io.StringIO()
+        self._writerow = csv.writer(self._buf).writerow
+
+    def read(self, size: int = -1) -> str:
+        buf = self._buf
+        writerow = self._writerow
+        for values in self._values:
+            writerow([_copy_value(v) for v in values])
+            if 0 <= size <= buf.tell():
+                break
+        data = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return data
+
+def copy_insert(conn, table: str, cols: List[str], rows: List[Dict[str, Any]], conflict: sql.Composable, cur=None) -> None:
+    """Bulk load rows via COPY into a staging table, then insert new keys.
+
+    The staging table has only ``cols`` and is dropped on commit, so the
+    final ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` keeps the
+    insert-only semantics of :func:`insert_many`.  Pass ``cur`` to reuse
+    an open cursor.
+    """
+    if cur is None:
+        with conn.cursor() as cur:
+            return copy_insert(conn, table, cols, rows, conflict, cur)
+    stage = sql.Identifier("_etl_stage")
+    col_list = sql.SQL(", ").join([sql.Identifier(c) for c in cols])
+    cur.execute(
+        sql.SQL("CREATE TEMP TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA").format(
+            stage, col_list, sql.Identifier(table)
+        )
+    )
+    cur.copy_expert(
+        sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv)").format(stage, col_list).as_string(conn),
+        _CopyReader(rows, cols),
+    )
+    # Apply rows in conflict-key order, as the batches arrive from the API,
+    # so concurrent runs on the same table take row locks in one order.
+    cur.execute(
+        sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} ORDER BY {} ON CONFLICT ({}) DO NOTHING").format(
+            sql.Identifier(table), col_list, col_list, stage, conflict, conflict
+        )
+    )
+    # Several batches may share one transaction, so drop the stage now
+    cur.execute(sql.SQL("DROP TABLE {}").format(stage))
+
+# Conflict targets, sanitised once at import.
+MAIN_CONFLICT_COLS: Tuple[str, ...] = (sanitize_identifier("_id"),)
+REPEAT_CONFLICT_COLS: Tuple[str, ...] = (sanitize_identifier("_submission_id"), sanitize_identifier("repeat_index"))
+
+@lru_cache(maxsize=None)
+def _conflict_target(conflict_cols: Tuple[str, ...]) -> sql.Composable:
+    return sql.SQL(", ").join([sql.Identifier(c) for c in conflict_cols])
+
+# Rendered INSERT statement parts (text before and after the VALUES list,
+# row template) keyed by (table, columns, conflict columns); consecutive
+# batches of a form usually share a column set.
+_INSERT_SQL_CACHE: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], Tuple[bytes, bytes, str]] = {}
+INSERT_SQL_CACHE_SIZE = 256
+
+def _insert_statement(cur, table: str, rows: List[Dict[str, Any]], conflict_cols: Tuple[str, ...]) -> Tuple[Optional[bytes], bool]:
+    """Prepare a batch for insertion and return ``(statement, altered)``.
+
+    Missing columns are added first; ``altered`` tells whether that took
+    an ALTER.  Batches of ``COPY_MIN_ROWS`` or more are loaded right away
+    through :func:`copy_insert` and the statement is ``None``; smaller
+    ones are rendered into a single multi-row INSERT (the same text
+    ``execute_values`` would send) for the caller to run.
+    """
+    if not rows:
+        return None, False
+    conn = cur.connection
     all_cols: set[str] = set()
     for r in rows:
         all_cols |= set(r.keys())
-    add_missing_columns(conn, table, list(all_cols))
+    altered = add_missing_columns(conn, table, list(all_cols), cur)
     cols = sorted(all_cols)
-    values = [tuple(r.get(c) for c in cols) for r in rows]
-    q = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT ({}) DO NOTHING").format(
-        sql.Identifier(table),
-        sql.SQL(", ").join([sql.Identifier(c) for c in cols]),
-        sql.SQL(", ").join([sql.Identifier(sanitize_identifier(c)) for c in conflict_cols]),
-    )
+    if len(rows) >= COPY_MIN_ROWS:
+        copy_insert(conn, table, cols, rows, _conflict_target(conflict_cols), cur)
+        return None, altered
+    key = (table, tuple(cols), conflict_cols)
+    parts = _INSERT_SQL_CACHE.get(key)
+    if parts is None:
+        if len(_INSERT_SQL_CACHE) >= INSERT_SQL_CACHE_SIZE:
+            _INSERT_SQL_CACHE.clear()
+        head = sql.SQL("INSERT INTO {} ({}) VALUES ").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join([sql.Identifier(c) for c in cols]),
+        ).as_string(conn)
+        tail = sql.SQL(" ON CONFLICT ({}) DO NOTHING").format(_conflict_target(conflict_cols)).as_string(conn)
+        encoding = psycopg2.extensions.encodings[conn.encoding]
+        parts = _INSERT_SQL_CACHE[key] = (
+            head.encode(encoding),
+            tail.encode(encoding),
+            "(" + ",".join(["%s"] * len(cols)) + ")",
+        )
+    head_b, tail_b, template = parts
+    mogrify = cur.mogrify
+    return head_b + b",".join([mogrify(template, v) for v in _row_tuples(rows, cols)]) + tail_b, altered
+
+def insert_many(conn, table: str, rows: List[Dict[str, Any]], conflict_cols: Tuple[str, ...]) -> bool:
+    """Insert a batch of rows with ON CONFLICT DO NOTHING.
+
+    Batches of ``COPY_MIN_ROWS`` or more go through :func:`copy_insert`;
+    smaller ones are sent as one multi-row INSERT.  ``conflict_cols`` must
+    already be sanitised (``MAIN_CONFLICT_COLS`` or
+    ``REPEAT_CONFLICT_COLS``).  The caller commits; returns True if
+    columns had to be added (see :func:`add_missing_columns`).
+    """
+    return insert_batches(conn, [(table, rows, conflict_cols)])
+
+def insert_batches(conn, batches: List[Tuple[str, List[Dict[str, Any]], Tuple[str, ...]]]) -> bool:
+    """Insert several ``(table, rows, conflict_cols)`` batches on one connection.
+
+    The INSERT statements of all small batches are joined and sent in a
+    single round-trip; large batches are still loaded with COPY.  One
+    cursor serves the whole call.  Returns True if any table was altered.
+    """
+    altered = False
     with conn.cursor() as cur:
-        execute_values(cur, q.as_string(conn), values)
-    conn.commit()
+        statements = []
+        for table, rows, conflict_cols in batches:
+            stmt, added = _insert_statement(cur, table, rows, conflict_cols)
+            altered = altered or added
+            if stmt is not None:
+                statements.append(stmt)
+        if statements:
+            cur.execute(b";".join(statements))
+    return altered
 
 # ---------------------------------------------------------------------------
 # API helpers
 
+def _json_body(r: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is None:
+        return r.json()
+    return orjson.loads(r.content)
+
 def get_asset_detail(session: requests.Session, asset_uid: str) -> Dict[str, Any]:
     """Fetch metadata about an asset (survey form)."""
     for path in (f"/assets/{asset_uid}.json", f"/assets/{asset_uid}/?format=json"):
@@ -405,7 +817,7 @@ def get_asset_detail(session: requests.Session, asset_uid: str) -> Dict[str, Any
         r = session.get(url, timeout=HTTP_TIMEOUT_SEC, verify=verify_param())
         if r.status_code == 200:
             try:
-                return r.json()
+                return _json_body(r)
             except Exception:
                 pass
     r.raise_for_status()
@@ -420,12 +832,17 @@ def get_data_url_from_asset(asset_detail: Dict[str, Any], asset_uid: str) -> str
     return API_BASE.rstrip("/") + f"/assets/{asset_uid}/data/"
 
 def fetch_new_submissions(session: requests.Session, data_url: str, last_id: int, label: str) -> Iterator[Dict[str, Any]]:
-    """Yield new submission records from the API after the given _id."""
+    """Yield new submission records from the API after the given _id.
+
+    Records are handed out one at a time and dropped from the page as they
+    go, so at most one page of raw submissions is held in memory and
+    already-processed records can be freed before the next page arrives.
+    """
     params: Dict[str, Any] = {
         "format": "json",
         "query": json.dumps({"_id": {"$gt": last_id}}),
         "sort": json.dumps({"_id": 1}),
-        "limit": 1000,
+        "limit": API_PAGE_SIZE,
     }
     url = data_url
     total = 0
@@ -440,32 +857,110 @@ def fetch_new_submissions(session: requests.Session, data_url: str, last_id: int
             verify=verify_param(),
         )
         r.raise_for_status()
-        data = r.json()
-        results = data.get("results", [])
-        total += len(results)
-        log.info(f"[api][{label}] page={page} fetched={len(results)}")
-        for rec in results:
-            yield rec
+        data = _json_body(r)
+        results = data.get("results") or []
         next_url = data.get("next")
+        del data, r
+        total += len(results)
+        log.info("[api][%s] page=%d fetched=%d", label, page, len(results))
+        results.reverse()
+        while results:
+            yield results.pop()
         if not next_url:
             break
         url = next_url
     dt = time.time() - t0
-    log.info(f"[api][{label}] total fetched={total} in {dt:.2f}s")
+    log.info("[api][%s] total fetched=%d in %.2fs", label, total, dt)
+
+_PREFETCH_END = object()
+
+def _prefetch(items: Iterator[Any], maxsize: int) -> Iterator[Any]:
+    """Yield from ``items`` while a background thread reads ahead.
+
+    The producer thread fills a bounded queue, so the next API page is
+    downloaded while the caller transforms and inserts the current one.
+    Producer exceptions are re-raised in the caller; if the caller stops
+    early the producer is told to stop at its next hand-over.
+    """
+    q: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    error: List[BaseException] = []
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as exc:
+            error.append(exc)
+        put(_PREFETCH_END)
+
+    threading.Thread(target=produce, name="etl-prefetch", daemon=True).start()
+    try:
+        while True:
+            item = q.get()
+            if item is _PREFETCH_END:
+                break
+            yield item
+        if error:
+            raise error[0]
+    finally:
+        stop.set()
 
 # ---------------------------------------------------------------------------
 # Data transformation
 
 def flatten(d: Dict[str, Any], parent: str = "", sep: str = "/") -> Dict[str, Any]:
-    """Flatten nested dictionaries into a single-level dict with slash-separated keys."""
-    items: List[Tuple[str, Any]] = []
-    for k, v in d.items():
-        nk = f"{parent}{sep}{k}" if parent else k
-        if isinstance(v, dict):
-            items.extend(flatten(v, nk, sep=sep).items())
+    """Flatten nested dictionaries into a single-level dict with slash-separated keys.
+
+    Walks the nesting with an explicit stack of item iterators, so keys
+    come out in the same depth-first order as a recursive walk.
+    """
+    out: Dict[str, Any] = {}
+    stack: List[Tuple[str, Iterator[Tuple[str, Any]]]] = [(parent, iter(d.items()))]
+    while stack:
+        prefix, it = stack[-1]
+        for k, v in it:
+            nk = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((nk, iter(v.items())))
+                break
+            out[nk] = v
         else:
-            items.append((nk, v))
-    return dict(items)
+            stack.pop()
+    return out
+
+@lru_cache(maxsize=1024)
+def _name_key(x: str) -> str:
+    """Case-insensitive comparison key for a group/repeat name."""
+    return _norm_name(x).lower()
+
+@lru_cache(maxsize=1024)
+def _repeat_suffix(root: str) -> str:
+    """Sanitised last segment of a repeat path: the repeat table's suffix
+    and, followed by ``__``, the prefix of its duplicated columns."""
+    return sanitize_identifier(root.rsplit("/", 1)[-1])
+
+# (root, tail, tail + ",", tail key, tail + "/", root differs from tail)
+# per repeat
+RepeatPlan = List[Tuple[str, str, str, str, str, bool]]
+
+def _compile_repeat_plan(repeat_roots: List[str]) -> RepeatPlan:
+    """Precompute the per-repeat values used for every submission."""
+    plan: RepeatPlan = []
+    for root in repeat_roots:
+        tail = last_segment(root)
+        plan.append((root, tail, tail + ",", _name_key(tail), tail + "/", root != tail))
+    return plan
 
 def last_segment(path: str) -> str:
     """Return the last segment of a slash-separated path."""
@@ -474,30 +969,33 @@ def last_segment(path: str) -> str:
 
 def prepare_rows_for_form(
     sub: Dict[str, Any],
-    repeat_roots: List[str],
+    repeat_plan: RepeatPlan,
     label: str,
 ) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, Any]]]]:
     """
     Transform a single submission into a main row and repeat rows.
 
+    ``repeat_plan`` comes from :func:`_compile_repeat_plan` and is built
+    once per form.
+
     Returns a tuple:
       - main_row: a sanitized dictionary for the main table
       - repeat_rows_by_root: mapping of repeat root path to list of sanitized rows
     """
     sub_copy = dict(sub)
     repeat_rows_by_root: Dict[str, List[Dict[str, Any]]] = {}
-    for root in repeat_roots:
-        tail = last_segment(root)
-        arr = sub_copy.pop(tail, None) or sub_copy.pop(tail + ",", None) or []
+    for root, tail, tail_comma, tail_key, tail_prefix, rebase in repeat_plan:
+        # An empty/missing ``tail`` falls back to the ``tail,`` spelling, so
+        # both keys are removed from the main row in that case.
+        arr = sub_copy.pop(tail, None) or sub_copy.pop(tail_comma, None) or []
         rows: List[Dict[str, Any]] = []
         for idx, item in enumerate(arr, start=1):
             flat = flatten(item)
             full: Dict[str, Any] = {}
             for k, v in flat.items():
-                head = k.split("/", 1)[0]
-                if _norm_name(head).lower() != _norm_name(tail).lower():
-                    k = f"{tail}/{k}"
-                if root != tail and (k.startswith(tail + "/") or k == tail):
+                if _name_key(k.partition("/")[0]) != tail_key:
+                    k = tail_prefix + k
+                if rebase and (k.startswith(tail_prefix) or k == tail):
                     k = root + k[len(tail) :]
                 full[k] = v
             full["_submission_id"] = sub.get("_id")
@@ -525,21 +1023,50 @@ def schema_mismatch_report(
     only_in_xls_main = sorted(list(xls_main - sample_main_keys))[:50]
     only_in_data_main = sorted(list((sample_main_keys - xls_main) - SYS_MAIN_SANITIZED))[:50]
     if only_in_xls_main:
-        log.warning(f"[schema][{main_table}] main: in XLS not in sample: {only_in_xls_main}")
+        log.warning("[schema][%s] main: in XLS not in sample: %s", main_table, only_in_xls_main)
     if only_in_data_main:
-        log.warning(f"[schema][{main_table}] main: in sample not in XLS: {only_in_data_main}")
+        log.warning("[schema][%s] main: in sample not in XLS: %s", main_table, only_in_data_main)
     for root, cols in xls_repeat_cols.items():
         xls_rep = {sanitize_identifier(p) for p, _ in cols}
         sample_rep = sample_rep_keys_by_root.get(root, set())
         only_in_xls_rep = sorted(list(xls_rep - sample_rep))[:50]
         only_in_data_rep = sorted(list(sample_rep - xls_rep))[:50]
         if only_in_xls_rep:
-            log.warning(f"[schema][{main_table}] repeat[{root}]: in XLS not in sample: {only_in_xls_rep}")
+            log.warning("[schema][%s] repeat[%s]: in XLS not in sample: %s", main_table, root, only_in_xls_rep)
         if only_in_data_rep:
-            log.warning(f"[schema][{main_table}] repeat[{root}]: in sample not in XLS: {only_in_data_rep}")
+            log.warning("[schema][%s] repeat[%s]: in sample not in XLS: %s", main_table, root, only_in_data_rep)
+
+# Columns counted per aggregate query in :func:`_non_null_counts`.
+NULL_COUNT_CHUNK = 100
+
+def _non_null_counts(conn, table: str, cols: List[str]) -> Dict[str, int]:
+    """Return the number of non-NULL values in each of ``cols``.
+
+    All columns are counted in one scan of the table (one query per
+    ``NULL_COUNT_CHUNK`` columns) instead of one scan per column.
+    """
+    counts: Dict[str, int] = {}
+    with conn.cursor() as cur:
+        for start in range(0, len(cols), NULL_COUNT_CHUNK):
+            chunk = cols[start : start + NULL_COUNT_CHUNK]
+            cur.execute(
+                sql.SQL("SELECT {} FROM {}").format(
+                    sql.SQL(", ").join([sql.SQL("COUNT({})").format(sql.Identifier(c)) for c in chunk]),
+                    sql.Identifier(table),
+                )
+            )
+            counts.update(zip(chunk, cur.fetchone()))
+    return counts
 
 def audit_all_null_columns(conn, table: str, max_cols: int = 200) -> None:
-    """Log columns that have no non-null values in the given table."""
+    """Log columns that have no non-null values in the given table.
+
+    A column whose ``null_frac`` in ``pg_stats`` is below 1 held a value
+    when the table was last analysed, and the ETL never updates or
+    deletes rows, so it still does; such columns are not counted.  Only
+    the remaining columns (all-NULL in the statistics, or without
+    statistics yet) get an exact count.
+    """
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -550,19 +1077,17 @@ def audit_all_null_columns(conn, table: str, max_cols: int = 200) -> None:
             (table,),
         )
         cols = [r[0] for r in cur.fetchall()]
+        cur.execute(
+            "SELECT attname FROM pg_stats WHERE schemaname='public' AND tablename=%s AND null_frac < 1",
+            (table,),
+        )
+        has_values = {r[0] for r in cur.fetchall()}
     skip = {"_id", "_submission_id", "repeat_index"}
-    checked = 0
-    for col in cols:
-        if col in skip:
-            continue
-        with conn.cursor() as cur:
-            cur.execute(sql.SQL('SELECT COUNT(*) FILTER (WHERE {} IS NOT NULL) FROM {}').format(sql.Identifier(col), sql.Identifier(table)))
-            (nnz,) = cur.fetchone()
+    to_check = [col for col in cols if col not in skip][:max_cols]
+    to_check = [col for col in to_check if col not in has_values]
+    for col, nnz in _non_null_counts(conn, table, to_check).items():
         if nnz == 0:
-            log.warning(f"[audit] column {table}.{col} has 0 non-null values")
-        checked += 1
-        if checked >= max_cols:
-            break
+            log.warning("[audit] column %s.%s has 0 non-null values", table, col)
 
 def cleanup_duplicate_repeat_columns(conn, table: str, repeat_prefix: str) -> None:
     """Drop duplicate repeat columns that are entirely NULL."""
@@ -577,25 +1102,23 @@ def cleanup_duplicate_repeat_columns(conn, table: str, repeat_prefix: str) -> No
             (table,),
         )
         cols = [r[0] for r in cur.fetchall()]
-    candidates: List[str] = []
-    for col in cols:
-        if col in ("_submission_id", "repeat_index"):
-            continue
-        if col.startswith(repeat_prefix):
-            continue
-        prefixed = repeat_prefix + col
-        if prefixed in cols:
-            with conn.cursor() as cur:
-                cur.execute(sql.SQL('SELECT COUNT(*) FILTER (WHERE {} IS NOT NULL) FROM {}').format(sql.Identifier(col), sql.Identifier(table)))
-                (nnz,) = cur.fetchone()
-            if nnz == 0:
-                candidates.append(col)
+    col_set = set(cols)
+    duplicates = [
+        col
+        for col in cols
+        if col not in ("_submission_id", "repeat_index")
+        and not col.startswith(repeat_prefix)
+        and repeat_prefix + col in col_set
+    ]
+    counts = _non_null_counts(conn, table, duplicates)
+    candidates = [col for col in duplicates if counts[col] == 0]
     if candidates:
         with conn.cursor() as cur:
             for col in candidates:
                 cur.execute(sql.SQL("ALTER TABLE {} DROP COLUMN {};").format(sql.Identifier(table), sql.Identifier(col)))
         conn.commit()
-        log.info(f"[cleanup] dropped empty duplicate cols from {table}: {candidates}")
+        _KNOWN_COLS.pop(table, None)
+        log.info("[cleanup] dropped empty duplicate cols from %s: %s", table, candidates)
 
 # ---------------------------------------------------------------------------
 # Core ETL logic
@@ -608,20 +1131,186 @@ class FormSpec:
     main_table: str
     xls_main_cols: List[Tuple[str, str]] = field(default_factory=list)
     xls_repeat_cols: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    repeat_plan: RepeatPlan = field(default_factory=list)
+
+# Parsed XLSForm and repeat-table map per (xls_path, main_table), stamped
+# with the file's mtime and size.
+_FORM_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], List[Tuple[str, str]], Dict[str, List[Tuple[str, str]]], RepeatPlan, Dict[str, str]]] = {}
+
+def _tables_exist(conn, tables: List[str]) -> bool:
+    """Return True if every table in ``tables`` exists."""
+    with conn.cursor() as cur:
+        cur.execute("SELECT bool_and(to_regclass(t) IS NOT NULL) FROM unnest(%s::text[]) AS t", (tables,))
+        (ok,) = cur.fetchone()
+    return bool(ok)
 
 def ensure_tables_for_form(conn, form: FormSpec) -> Dict[str, str]:
-    """Ensure the main and repeat tables exist for a form."""
+    """Ensure the main and repeat tables exist for a form.
+
+    While the XLSForm file is unchanged and its tables still exist, the
+    cached parse is reused: the file is not re-read and no DDL is sent.
+    """
+    st = os.stat(form.xls_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = (form.xls_path, form.main_table)
+    cached = _FORM_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        _, main_cols, rep_cols, plan, cached_map = cached
+        if _tables_exist(conn, [form.main_table, *cached_map.values()]):
+            form.xls_main_cols = main_cols
+            form.xls_repeat_cols = rep_cols
+            form.repeat_plan = plan
+            # Column sets are still re-read once per run
+            for tbl in (form.main_table, *cached_map.values()):
+                _KNOWN_COLS.pop(tbl, None)
+            return dict(cached_map)
     main_cols, rep_cols = parse_xls_full_paths(form.xls_path)
     form.xls_main_cols = main_cols
     form.xls_repeat_cols = rep_cols
+    form.repeat_plan = _compile_repeat_plan(list(rep_cols.keys()))
     ensure_main_table(conn, form.main_table, form.xls_main_cols)
     repeat_map: Dict[str, str] = {}
     for root in form.xls_repeat_cols.keys():
-        tail = root.split("/")[-1]
-        rep_table = f"{form.main_table}__{sanitize_identifier(tail)}"
+        rep_table = f"{form.main_table}__{_repeat_suffix(root)}"
         ensure_repeat_table(conn, rep_table, form.xls_repeat_cols[root])
         repeat_map[root] = rep_table
-    return repeat_map
+    _FORM_CACHE[key] = (stamp, main_cols, rep_cols, form.repeat_plan, repeat_map)
+    return dict(repeat_map)
+
+class _RepeatFlusher:
+    """Flush repeat-table batches on a small pool of worker connections.
+
+    Every repeat table is pinned to one worker slot, and each slot has its
+    own connection borrowed from the pool; psycopg2 releases the GIL while
+    waiting on the server, so inserts into tables on different slots
+    overlap.  A flush with a single pending table is written on the
+    caller's connection instead, which needs no worker connection at all.
+
+    Commits are deferred, so a table written through one connection
+    holds locks there until the next commit and must not be written
+    through another one meanwhile; ``_owner`` records which connection
+    (a slot, or ``-1`` for the caller's) each table used since the last
+    commit.  With one worker everything is written on the caller's
+    connection.
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._slots: Dict[str, int] = {}
+        self._conns: List[Any] = []
+        self._owner: Dict[str, int] = {}
+        # Set when a flush added columns; cleared by flush_and_commit
+        self.altered = False
+
+    def _slot(self, tbl: str) -> int:
+        slot = self._slots.get(tbl)
+        if slot is None:
+            slot = self._slots[tbl] = len(self._slots) % self._workers
+            if slot == len(self._conns):
+                self._conns.append(_pg_acquire())
+        return slot
+
+    def _insert(self, job: Tuple[int, List[Tuple[str, List[Dict[str, Any]]]]]) -> bool:
+        slot, items = job
+        conn = self._conns[slot]
+        return insert_batches(conn, [(tbl, rows, REPEAT_CONFLICT_COLS) for tbl, rows in items])
+
+    def flush(self, conn, batch_rep: Dict[str, List[Dict[str, Any]]], tables: Optional[List[str]] = None) -> int:
+        """Insert and remove the batches of ``tables`` (default: all); return the rows written.
+
+        ``batch_rep`` only holds tables with buffered rows, so flushed
+        tables are deleted from it rather than reset to an empty list.
+        """
+        if tables is None:
+            pending = list(batch_rep.items())
+        else:
+            pending = [(tbl, batch_rep[tbl]) for tbl in tables]
+        if not pending:
+            return 0
+        if self._pool is None:
+            altered = insert_batches(conn, [(tbl, rows, REPEAT_CONFLICT_COLS) for tbl, rows in pending])
+        else:
+            jobs: Dict[int, List[Tuple[str, List[Dict[str, Any]]]]] = {}
+            for item in pending:
+                slot = self._owner.get(item[0])
+                if slot is None:
+                    slot = self._owner[item[0]] = -1 if len(pending) == 1 else self._slot(item[0])
+                jobs.setdefault(slot, []).append(item)
+            local = jobs.pop(-1, [])
+            futures = [self._pool.submit(self._insert, job) for job in jobs.items()]
+            altered = bool(local) and insert_batches(conn, [(tbl, rows, REPEAT_CONFLICT_COLS) for tbl, rows in local])
+            altered = any([f.result() for f in futures]) or altered
+        self.altered = self.altered or altered
+        written = 0
+        for tbl, rows in pending:
+            written += len(rows)
+            del batch_rep[tbl]
+        return written
+
+    def commit(self) -> None:
+        """Commit the worker connections' pending inserts."""
+        for conn in self._conns:
+            _commit(conn)
+
+    def flush_and_commit(self, conn, batch_rep: Dict[str, List[Dict[str, Any]]]) -> int:
+        """Write every buffered repeat row, then commit the workers and ``conn``.
+
+        The buffered repeat rows belong to main rows about to be committed
+        on ``conn``, so they are made durable first.  Returns the rows
+        written.
+        """
+        written = self.flush(conn, batch_rep)
+        self.commit()
+        _commit(conn)
+        self._owner.clear()
+        self.altered = False
+        return written
+
+    def close(self) -> None:
+        """Stop the worker threads and return their connections; idempotent."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        conns, self._conns = self._conns, []
+        for conn in conns:
+            _pg_release(conn)
+
+def _check_table(conn, table: str, repeat_prefix: Optional[str]) -> None:
+    if RUN_NULL_AUDIT:
+        audit_all_null_columns(conn, table, max_cols=200)
+    if repeat_prefix is not None:
+        cleanup_duplicate_repeat_columns(conn, table, repeat_prefix=repeat_prefix)
+
+def _check_table_pooled(job: Tuple[str, Optional[str]]) -> None:
+    conn = _pg_acquire()
+    try:
+        _check_table(conn, *job)
+    finally:
+        _pg_release(conn)
+
+def run_table_checks(conn, form: FormSpec, repeat_table_map: Dict[str, str]) -> None:
+    """Run the null audit and duplicate-column cleanup for a form's tables.
+
+    The checks are independent per table, so with several tables they run
+    concurrently on up to ``REPEAT_FLUSH_WORKERS`` pooled connections;
+    each table's audit still runs before its cleanup.
+    """
+    jobs: List[Tuple[str, Optional[str]]] = []
+    if RUN_NULL_AUDIT:
+        jobs.append((form.main_table, None))
+    if RUN_NULL_AUDIT or AUTO_DROP_EMPTY_DUP_REPEAT_COLS:
+        for root in form.xls_repeat_cols.keys():
+            tbl = repeat_table_map.get(root)
+            if tbl:
+                jobs.append((tbl, _repeat_suffix(root) + "__"))
+    workers = min(REPEAT_FLUSH_WORKERS, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            _check_table(conn, *job)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_check_table_pooled, jobs))
 
 def run_once(form: FormSpec) -> Tuple[int, int]:
     """
@@ -631,60 +1320,98 @@ def run_once(form: FormSpec) -> Tuple[int, int]:
     many new rows were inserted into the main table and repeat tables.
     Any exceptions are propagated to the caller.  The caller should
     handle exceptions and update status accordingly.
+
+    Main rows are flushed every ``MAIN_BATCH_SIZE`` submissions and each
+    repeat table whenever it buffers ``REPEAT_BATCH_SIZE`` rows, or sooner
+    once a batch's estimated size reaches ``BATCH_MAX_BYTES``.  Inserts
+    are committed every ``COMMIT_EVERY_BATCHES`` main batches and at the
+    end, repeat tables before the main table: the next run resumes
+    after the highest committed main ``_id``, so a main row must never be
+    durable without its repeat rows.  A flush that had to add columns is
+    committed straight away the same way, so the ALTER's exclusive lock
+    is not held across further API pages.
     """
-    conn = pg_connect()
+    conn = _pg_acquire()
+    flusher = _RepeatFlusher(REPEAT_FLUSH_WORKERS)
     try:
         repeat_table_map = ensure_tables_for_form(conn, form)
         last_id = get_max_main_id(conn, form.main_table)
-        log.info(f"[info][{form.main_table}] last _id = {last_id}")
+        log.info("[info][%s] last _id = %s", form.main_table, last_id)
         session = kpi_session(form.api_token)
         asset = get_asset_detail(session, form.asset_uid)
         data_url = get_data_url_from_asset(asset, form.asset_uid)
-        log.info(f"[info][{form.main_table}] data endpoint: {data_url}")
+        log.info("[info][%s] data endpoint: %s", form.main_table, data_url)
         batch_main: List[Dict[str, Any]] = []
-        batch_rep: Dict[str, List[Dict[str, Any]]] = {t: [] for t in repeat_table_map.values()}
+        batch_rep: Dict[str, List[Dict[str, Any]]] = {}
+        # Estimated payload of the buffered rows, see ``_row_bytes``
+        main_bytes = 0
+        rep_bytes: Dict[str, int] = {}
         total_main = 0
         total_rep = 0
         sample_main_keys: set[str] = set()
         sample_rep_keys_by_root: Dict[str, set[str]] = {}
         sample_main_seen = 0
         sample_rep_seen: Dict[str, int] = {}
-        repeat_roots_full = list(form.xls_repeat_cols.keys())
         label = f"{form.main_table}/{form.asset_uid}"
-        for sub in fetch_new_submissions(session, data_url, last_id, label=label):
-            main_row, rep_rows_by_root = prepare_rows_for_form(sub, repeat_roots_full, label=label)
-            if sample_main_seen < 3:
-                sample_main_keys |= set(main_row.keys())
-                sample_main_seen += 1
-            for root, rows in rep_rows_by_root.items():
-                if not rows:
-                    continue
-                sample_rep_keys_by_root.setdefault(root, set())
-                if sample_rep_seen.get(root, 0) < 3:
-                    sample_rep_keys_by_root[root] |= set(rows[0].keys())
-                    sample_rep_seen[root] = sample_rep_seen.get(root, 0) + 1
-            batch_main.append(main_row)
-            for root, rows in rep_rows_by_root.items():
-                tbl = repeat_table_map.get(root)
-                if tbl and rows:
-                    batch_rep.setdefault(tbl, []).extend(rows)
-            if len(batch_main) >= 1000:
-                insert_many(conn, form.main_table, batch_main, conflict_cols=["_id"])
-                total_main += len(batch_main)
-                batch_main.clear()
-                for tbl, rows in batch_rep.items():
-                    if rows:
-                        insert_many(conn, tbl, rows, conflict_cols=["_submission_id", "repeat_index"])
-                        total_rep += len(rows)
-                        batch_rep[tbl] = []
+        uncommitted = 0
+        submissions = fetch_new_submissions(session, data_url, last_id, label=label)
+        if PREFETCH_QUEUE_SIZE > 0:
+            submissions = _prefetch(submissions, PREFETCH_QUEUE_SIZE)
+        try:
+            for sub in submissions:
+                main_row, rep_rows_by_root = prepare_rows_for_form(sub, form.repeat_plan, label=label)
+                if sample_main_seen < 3:
+                    sample_main_keys.update(main_row)
+                    sample_main_seen += 1
+                batch_main.append(main_row)
+                main_bytes += _row_bytes(main_row)
+                full: List[str] = []
+                for root, rows in rep_rows_by_root.items():
+                    if not rows:
+                        continue
+                    # The schema report samples the first rows of each repeat
+                    seen = sample_rep_seen.get(root, 0)
+                    if seen < 3:
+                        sample_rep_keys_by_root.setdefault(root, set()).update(rows[0])
+                        sample_rep_seen[root] = seen + 1
+                    tbl = repeat_table_map.get(root)
+                    if tbl:
+                        pending = batch_rep.setdefault(tbl, [])
+                        pending.extend(rows)
+                        size = rep_bytes[tbl] = rep_bytes.get(tbl, 0) + sum(map(_row_bytes, rows))
+                        if (len(pending) >= REPEAT_BATCH_SIZE or size >= BATCH_MAX_BYTES) and tbl not in full:
+                            full.append(tbl)
+                altered = False
+                if full:
+                    total_rep += flusher.flush(conn, batch_rep, full)
+                    for tbl in full:
+                        del rep_bytes[tbl]
+                    altered = flusher.altered
+                if len(batch_main) >= MAIN_BATCH_SIZE or main_bytes >= BATCH_MAX_BYTES:
+                    altered = insert_many(conn, form.main_table, batch_main, conflict_cols=MAIN_CONFLICT_COLS) or altered
+                    total_main += len(batch_main)
+                    batch_main.clear()
+                    main_bytes = 0
+                    uncommitted += 1
+                if altered or uncommitted >= COMMIT_EVERY_BATCHES:
+                    total_rep += flusher.flush_and_commit(conn, batch_rep)
+                    rep_bytes.clear()
+                    uncommitted = 0
+        finally:
+            # Stop the read-ahead thread now rather than when the generator
+            # is collected; an exception's traceback would keep it fetching.
+            submissions.close()
         if batch_main:
-            insert_many(conn, form.main_table, batch_main, conflict_cols=["_id"])
+            insert_many(conn, form.main_table, batch_main, conflict_cols=MAIN_CONFLICT_COLS)
             total_main += len(batch_main)
-        for tbl, rows in batch_rep.items():
-            if rows:
-                insert_many(conn, tbl, rows, conflict_cols=["_submission_id", "repeat_index"])
-                total_rep += len(rows)
-        log.info(f"[done][{form.main_table}] inserted main={total_main}, repeat={total_rep}")
+        total_rep += flusher.flush_and_commit(conn, batch_rep)
+        # Hand the worker connections back before the table checks borrow theirs
+        flusher.close()
+        log.info("[done][%s] inserted main=%d, repeat=%d", form.main_table, total_main, total_rep)
+        if not total_main:
+            # Nothing new was sampled or written, so the reports and
+            # checks would only repeat the previous run's findings.
+            return total_main, total_rep
         schema_mismatch_report(
             form.xls_main_cols,
             form.xls_repeat_cols,
@@ -692,26 +1419,20 @@ def run_once(form: FormSpec) -> Tuple[int, int]:
             sample_main_keys,
             sample_rep_keys_by_root,
         )
-        if RUN_NULL_AUDIT:
-            audit_all_null_columns(conn, form.main_table, max_cols=200)
-            for root in form.xls_repeat_cols.keys():
-                tbl = repeat_table_map.get(root)
-                if tbl:
-                    audit_all_null_columns(conn, tbl, max_cols=200)
-        for root in form.xls_repeat_cols.keys():
-            tbl = repeat_table_map.get(root)
-            if tbl:
-                prefix = sanitize_identifier(root.split("/")[-1]) + "__"
-                cleanup_duplicate_repeat_columns(conn, tbl, repeat_prefix=prefix)
+        run_table_checks(conn, form, repeat_table_map)
         return total_main, total_rep
     finally:
-        conn.close()
+        flusher.close()
+        _pg_release(conn)
 
 # ---------------------------------------------------------------------------
 # CLI support
 
 def cli_main() -> None:
     """Entry point for running the ETL from the command line."""
+    # Imported here: the Django app imports this module only for run_once
+    import argparse
+
     p = argparse.ArgumentParser(description="Kobo/SurveyZen ETL (single run)")
     p.add_argument("--api-token", required=True, help="API Token for Kobo/SurveyZen")
     p.add_argument("--asset-uid", required=True, help="Asset UID of the form")